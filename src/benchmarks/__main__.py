@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from json import dumps, loads
+from pathlib import Path
+
+from click import Path as ClickPath
+from click import echo, group
+from utilities.click import CONTEXT_SETTINGS, option
+
+from benchmarks._suite import CASES, compare, run_suite
+from benchmarks.bundle import main as bundle_main
+from benchmarks.modify_pre_commit import main as modify_pre_commit_main
+from benchmarks.parallel import main as parallel_main
+from benchmarks.read_toml import main as read_toml_main
+
+
+@group(**CONTEXT_SETTINGS)
+def cli() -> None: ...
+
+
+@cli.command(name="run", **CONTEXT_SETTINGS)
+@option("--size", "sizes", type=int, multiple=True, default=[10, 100, 1000])
+@option("--number", type=int, default=5, help="Repetitions per measurement")
+@option("--hook", "hooks", multiple=True, help="Restrict to these hooks")
+@option(
+    "--output",
+    type=ClickPath(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the timings as JSON",
+)
+@option(
+    "--baseline",
+    type=ClickPath(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Compare against a JSON baseline",
+)
+@option("--threshold", type=float, default=0.2, help="Allowed relative slowdown")
+def run_cli(
+    *,
+    sizes: tuple[int, ...],
+    number: int,
+    hooks: tuple[str, ...],
+    output: Path | None,
+    baseline: Path | None,
+    threshold: float,
+) -> None:
+    results = run_suite(
+        sizes=sizes, number=number, hooks=hooks if len(hooks) >= 1 else None
+    )
+    for key, duration in results.items():
+        echo(f"{key:<40} {1e3 * duration:>10.2f}ms")
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        _ = output.write_text(dumps(results, indent=2, sort_keys=True) + "\n")
+    if baseline is not None:
+        regressions = compare(loads(baseline.read_text()), results, threshold=threshold)
+        for key, ratio in regressions.items():
+            echo(f"REGRESSION {key}: {ratio:.2f}x baseline")
+        if len(regressions) >= 1:
+            raise SystemExit(1)
+
+
+@cli.command(name="list", **CONTEXT_SETTINGS)
+def list_cli() -> None:
+    for case in CASES:
+        echo(case.hook)
+
+
+cli.add_command(bundle_main, name="bundle")
+cli.add_command(modify_pre_commit_main, name="modify-pre-commit")
+cli.add_command(parallel_main, name="parallel")
+cli.add_command(read_toml_main, name="read-toml")
+
+
+if __name__ == "__main__":
+    cli()
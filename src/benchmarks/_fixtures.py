@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import DYCW_PRE_COMMIT_HOOKS_URL
+
+from qrt_pre_commit_hooks._constants import QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_dockerfile(path: Path, /, *, lines: int) -> Path:
+    text = "\n".join(f"RUN echo {i}" for i in range(lines))
+    return _write(path, f"FROM python:3.13-slim\n{text}\n")
+
+
+def write_envrc(path: Path, /, *, lines: int) -> Path:
+    text = "\n".join(f"export VAR_{i}='value-{i}'" for i in range(lines))
+    return _write(path, f"#!/usr/bin/env sh\n{text}\n")
+
+
+def write_pre_commit_config(path: Path, /, *, repos: int, hooks: int = 10) -> Path:
+    lines: list[str] = [
+        "repos:",
+        f"  - repo: {DYCW_PRE_COMMIT_HOOKS_URL}",
+        "    rev: 0.0.0",
+        "    hooks:",
+        "      - id: add-hooks",
+        "        args:",
+        *(f"          - --arg-{i}=value-{i}" for i in range(hooks)),
+        f"  - repo: {QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL}",
+        "    rev: 0.0.0",
+        "    hooks:",
+        "      - id: add-qrt-hooks",
+    ]
+    for i in range(repos):
+        lines.extend([
+            f"  - repo: https://github.com/example/repo-{i}",
+            f"    rev: v{i}.0.0",
+            "    hooks:",
+        ])
+        for j in range(hooks):
+            lines.extend([
+                f"      - id: hook-{i}-{j}",
+                "        args:",
+                f"          - --option-{j}=value-{j}",
+                f"        priority: {10 * (1 + j % 4)}",
+            ])
+    return _write(path, "\n".join(lines) + "\n")
+
+
+def write_push_yaml(path: Path, /, *, jobs: int) -> Path:
+    lines: list[str] = ["jobs:"]
+    for i in range(jobs):
+        lines.extend([
+            f"  job-{i}:",
+            "    runs-on: ubuntu-latest",
+            "    steps:",
+            f"      - name: Step {i}",
+            f"        run: echo {i}",
+        ])
+    return _write(path, "\n".join(lines) + "\n")
+
+
+def write_pyproject(path: Path, /, *, sources: int) -> Path:
+    lines: list[str] = [
+        "[project]",
+        'name = "package"',
+        'version = "0.1.0"',
+        "dependencies = [",
+        *(f'  "dependency-{i}>=1.0",' for i in range(sources)),
+        "]",
+        "",
+        "[tool.uv.sources]",
+        *(f'source-{i} = {{ index = "nanode" }}' for i in range(sources)),
+    ]
+    return _write(path, "\n".join(lines) + "\n")
+
+
+def _write(path: Path, text: str, /) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(text)
+    return path
+
+
+__all__ = [
+    "write_dockerfile",
+    "write_envrc",
+    "write_pre_commit_config",
+    "write_push_yaml",
+    "write_pyproject",
+]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import (
+    ENVRC,
+    GITEA_PUSH_YAML,
+    PRE_COMMIT_CONFIG_YAML,
+    PYPROJECT_TOML,
+)
+
+from benchmarks._fixtures import (
+    write_dockerfile,
+    write_envrc,
+    write_pre_commit_config,
+    write_push_yaml,
+    write_pyproject,
+)
+from qrt_pre_commit_hooks._constants import DOCKERFILE
+from qrt_pre_commit_hooks._enums import Index, Package
+from qrt_pre_commit_hooks.hooks import (
+    _add_qrt_hooks,
+    _modify_ci_push,
+    _modify_direnv,
+    _modify_pre_commit,
+    _modify_pyproject,
+    _setup_docker,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Case:
+    hook: str
+    setup: Callable[[Path, int], Path]
+    run: Callable[[Path], bool]
+
+
+def _setup_add_qrt_hooks(root: Path, size: int, /) -> Path:
+    _ = write_pyproject(root / PYPROJECT_TOML, sources=size)
+    return write_pre_commit_config(root / PRE_COMMIT_CONFIG_YAML, repos=size)
+
+
+def _setup_docker_case(root: Path, size: int, /) -> Path:
+    _ = write_pre_commit_config(root / PRE_COMMIT_CONFIG_YAML, repos=size)
+    return write_dockerfile(root / DOCKERFILE, lines=size)
+
+
+CASES: list[Case] = [
+    Case(
+        hook="add-qrt-hooks",
+        setup=_setup_add_qrt_hooks,
+        run=lambda p: _add_qrt_hooks._run(path=p),  # noqa: SLF001
+    ),
+    Case(
+        hook="modify-ci-push",
+        setup=lambda r, n: write_push_yaml(r / GITEA_PUSH_YAML, jobs=n),
+        run=lambda p: _modify_ci_push._run(Index.nanode, path=p),  # noqa: SLF001
+    ),
+    Case(
+        hook="modify-direnv",
+        setup=lambda r, n: write_envrc(r / ENVRC, lines=n),
+        run=lambda p: _modify_direnv._run(  # noqa: SLF001
+            path=p, package=Package.trading
+        ),
+    ),
+    Case(
+        hook="modify-pre-commit",
+        setup=lambda r, n: write_pre_commit_config(r / PRE_COMMIT_CONFIG_YAML, repos=n),
+        run=lambda p: _modify_pre_commit._run(  # noqa: SLF001
+            path=p, ci_image=True, package=Package.trading
+        ),
+    ),
+    Case(
+        hook="modify-pyproject",
+        setup=lambda r, n: write_pyproject(r / PYPROJECT_TOML, sources=n),
+        run=lambda p: _modify_pyproject._run(Package.trading, path=p),  # noqa: SLF001
+    ),
+    Case(
+        hook="setup-docker",
+        setup=_setup_docker_case,
+        run=lambda p: _setup_docker._run_dockerfile(path=p),  # noqa: SLF001
+    ),
+]
+
+
+def run_suite(
+    *, sizes: Iterable[int], number: int = 5, hooks: Iterable[str] | None = None
+) -> dict[str, float]:
+    hooks_use = None if hooks is None else set(hooks)
+    results: dict[str, float] = {}
+    for case in CASES:
+        if (hooks_use is not None) and (case.hook not in hooks_use):
+            continue
+        for size in sizes:
+            results[f"{case.hook}/{size}/cold"] = _time_cold(case, size, number=number)
+            results[f"{case.hook}/{size}/warm"] = _time_warm(case, size, number=number)
+    return results
+
+
+def compare(
+    baseline: dict[str, float], current: dict[str, float], /, *, threshold: float
+) -> dict[str, float]:
+    return {
+        key: ratio
+        for key in sorted(baseline.keys() & current.keys())
+        if (ratio := current[key] / baseline[key]) > 1.0 + threshold
+    }
+
+
+def _time_cold(case: Case, size: int, /, *, number: int) -> float:
+    durations: list[float] = []
+    for _ in range(number):
+        with TemporaryDirectory() as temp:
+            path = case.setup(Path(temp), size)
+            start = perf_counter()
+            _ = case.run(path)
+            durations.append(perf_counter() - start)
+    return median(durations)
+
+
+def _time_warm(case: Case, size: int, /, *, number: int) -> float:
+    durations: list[float] = []
+    with TemporaryDirectory() as temp:
+        path = case.setup(Path(temp), size)
+        _ = case.run(path)
+        for _ in range(number):
+            start = perf_counter()
+            _ = case.run(path)
+            durations.append(perf_counter() - start)
+    return median(durations)
+
+
+__all__ = ["CASES", "Case", "compare", "run_suite"]
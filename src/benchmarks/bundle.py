@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import sys
+from os import environ
+from pathlib import Path
+from subprocess import DEVNULL, check_call
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from click import command, echo, option
+from utilities.click import CONTEXT_SETTINGS
+
+from qrt_pre_commit_hooks._bundle import build_bundle
+from qrt_pre_commit_hooks._client import SERVER_ENV_VAR
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+
+_ROOT = Path(__file__).parents[2]
+
+
+def _time(args: Sequence[str | Path], /, *, env: Mapping[str, str]) -> float:
+    start = perf_counter()
+    _ = check_call(list(map(str, args)), env=dict(env), stdout=DEVNULL, stderr=DEVNULL)
+    return perf_counter() - start
+
+
+@command(**CONTEXT_SETTINGS)
+@option("--hook", default="modify-direnv", help="The hook to invoke")
+def main(*, hook: str) -> None:
+    with TemporaryDirectory() as temp:
+        env = {**environ, "XDG_CACHE_HOME": str(Path(temp, "cache"))}
+        env[SERVER_ENV_VAR] = "0"
+        venv = Path(temp, "venv")
+        install = _time(["uv", "venv", "--quiet", venv], env=env) + _time(
+            ["uv", "pip", "install", "--quiet", "--python", venv, _ROOT], env=env
+        )
+        first = _time([venv / "bin" / hook, "--help"], env=env)
+        start = perf_counter()
+        bundle = build_bundle(Path(temp, "bundle"))
+        build = perf_counter() - start
+        cold = _time([sys.executable, bundle, hook, "--help"], env=env)
+        warm = _time([sys.executable, bundle, hook, "--help"], env=env)
+    echo(f"language: python  install {install:>7.2f}s  first call {first:>6.2f}s")
+    echo(f"language: script  install {0.0:>7.2f}s  first call {cold:>6.2f}s")
+    echo(f"                  (build {build:.2f}s, later calls {warm:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
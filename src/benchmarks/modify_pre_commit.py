@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from click import command, echo, option
+from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML
+from pre_commit_hooks.utilities import yield_yaml_dict
+from utilities.click import CONTEXT_SETTINGS
+
+from benchmarks._fixtures import write_pre_commit_config
+from qrt_pre_commit_hooks._enums import Package
+from qrt_pre_commit_hooks.hooks import _modify_pre_commit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from utilities.types import StrDict
+
+
+_SESSIONS: list[Path] = []
+
+
+@contextmanager
+def _counting_yield_yaml_dict(path: Path, /, **kwargs: Any) -> Iterator[StrDict]:
+    _SESSIONS.append(path)
+    with yield_yaml_dict(path, **kwargs) as dict_:
+        yield dict_
+
+
+def _run_before(*, path: Path) -> bool:
+    # replay the pre-batching behaviour: one YAML session per mutation
+    package = Package.trading
+    steps: list[Callable[[StrDict], None]] = [
+        _modify_pre_commit._add_ci_token_github,  # noqa: SLF001
+        _modify_pre_commit._add_pytest_sops_age_key,  # noqa: SLF001
+        _modify_pre_commit._add_priority,  # noqa: SLF001
+        _modify_pre_commit._add_ci_image,  # noqa: SLF001
+        lambda d: _modify_pre_commit._add_index(d, package.pkg_index),  # noqa: SLF001
+    ]
+    modifications: set[Path] = set()
+    for step in steps:
+        with _counting_yield_yaml_dict(path, modifications=modifications) as dict_:
+            step(dict_)
+    return len(modifications) == 0
+
+
+def _run_after(*, path: Path) -> bool:
+    return _modify_pre_commit._run(  # noqa: SLF001
+        path=path, ci_image=True, package=Package.trading
+    )
+
+
+@command(**CONTEXT_SETTINGS)
+@option("--repos", type=int, default=200, help="Number of repos in the config")
+@option("--hooks", type=int, default=10, help="Number of hooks per repo")
+@option("--number", type=int, default=5, help="Number of invocations to time")
+def main(*, repos: int, hooks: int, number: int) -> None:
+    _modify_pre_commit.yield_yaml_dict = _counting_yield_yaml_dict
+    for name, func in [("before", _run_before), ("after", _run_after)]:
+        with TemporaryDirectory() as temp:
+            path = write_pre_commit_config(
+                Path(temp, PRE_COMMIT_CONFIG_YAML), repos=repos, hooks=hooks
+            )
+            _ = func(path=path)  # bring the config to a conformant state
+            _SESSIONS.clear()
+            start = perf_counter()
+            for _ in range(number):
+                _ = func(path=path)
+            duration = (perf_counter() - start) / number
+            sessions = len(_SESSIONS) / number
+            echo(
+                f"{name:>6}: {sessions:.0f} parse/dump session(s), {1e3 * duration:.1f}ms per invocation ({path.stat().st_size:,} bytes)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from click import command, echo, option
+from pre_commit_hooks.constants import ENVRC, PYPROJECT_TOML
+from utilities.click import CONTEXT_SETTINGS
+
+from benchmarks._fixtures import write_envrc, write_pyproject
+from qrt_pre_commit_hooks._cache import NO_CACHE_ENV_VAR
+from qrt_pre_commit_hooks._enums import Package
+from qrt_pre_commit_hooks._executor import run_parallel
+from qrt_pre_commit_hooks.hooks import _modify_direnv, _modify_pyproject
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _get_funcs(root: Path, /, *, paths: int) -> list[Callable[[], bool]]:
+    pyprojects: list[Path] = []
+    envrcs: list[Path] = []
+    for i in range(paths):
+        package = root / f"pkg-{i}"
+        pyprojects.append(write_pyproject(package / PYPROJECT_TOML, sources=20))
+        envrcs.append(write_envrc(package / ENVRC, lines=20))
+    return [
+        *_modify_pyproject._get_funcs(  # noqa: SLF001
+            paths=tuple(pyprojects), package=Package.trading
+        ),
+        *_modify_direnv._get_funcs(  # noqa: SLF001
+            paths=tuple(envrcs), package=Package.trading
+        ),
+    ]
+
+
+@command(**CONTEXT_SETTINGS)
+@option("--paths", type=int, default=200, help="Number of packages in the monorepo")
+@option("--jobs", "jobs_list", type=int, multiple=True, default=[1, 4, 8, 0])
+def main(*, paths: int, jobs_list: tuple[int, ...]) -> None:
+    environ[NO_CACHE_ENV_VAR] = "1"
+    baseline: float | None = None
+    for jobs in jobs_list:
+        with TemporaryDirectory() as temp:
+            funcs = _get_funcs(Path(temp), paths=paths)
+            start = perf_counter()
+            _ = [f() for f in funcs] if jobs == 1 else run_parallel(funcs, jobs=jobs)
+            duration = perf_counter() - start
+        baseline = duration if baseline is None else baseline
+        echo(
+            f"jobs={jobs:<3} {len(funcs)} runs in {1e3 * duration:.1f}ms ({baseline / duration:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
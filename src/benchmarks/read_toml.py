@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from click import Path as ClickPath
+from click import command, echo, option
+from pre_commit_hooks.constants import PYPROJECT_TOML
+from pre_commit_hooks.utilities import get_table
+from tomlkit.api import loads
+from utilities.click import CONTEXT_SETTINGS
+
+from benchmarks._fixtures import write_pyproject
+from qrt_pre_commit_hooks._toml import get_project
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_ROOT = Path(__file__).parents[2]
+
+
+def _tomlkit(path: Path, /) -> object:
+    return get_table(loads(path.read_text()), "project")["name"]
+
+
+def _tomllib(path: Path, /) -> object:
+    return get_project(path)["name"]
+
+
+def _time(func: Callable[[Path], object], path: Path, /, *, number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        _ = func(path)
+    return (perf_counter() - start) / number
+
+
+@command(**CONTEXT_SETTINGS)
+@option(
+    "--path",
+    type=ClickPath(exists=True, dir_okay=False, path_type=Path),
+    default=_ROOT / PYPROJECT_TOML,
+    help="The pyproject.toml to read",
+)
+@option("--sources", type=int, default=500, help="Size of the synthetic pyproject")
+@option("--number", type=int, default=200, help="Reads per measurement")
+def main(*, path: Path, sources: int, number: int) -> None:
+    with TemporaryDirectory() as temp:
+        synthetic = write_pyproject(Path(temp, PYPROJECT_TOML), sources=sources)
+        for label, path_i in [(path.name, path), (f"{sources} sources", synthetic)]:
+            slow = _time(_tomlkit, path_i, number=number)
+            fast = _time(_tomllib, path_i, number=number)
+            echo(
+                f"{label:<16} tomlkit {1e6 * slow:>9.1f}us  tomllib {1e6 * fast:>8.1f}us  ({slow / fast:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,66 @@
 from __future__ import annotations
 
-import sys
-
-from utilities.constants import MONTH
-from utilities.core import is_debug, set_up_logging
-from utilities.traceback import make_except_hook
-
-from qrt_pre_commit_hooks._click import (
-    index_req_option,
-    package_option,
-    package_req_option,
-)
-from qrt_pre_commit_hooks._constants import (
-    ACTION_TOKEN,
-    DOCKERFILE,
-    GITEA_READ_TOKEN,
-    GITEA_READ_WRITE_TOKEN,
-    NANODE_PYPI_PASSWORD,
-    QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL,
-    ROOT_PEM,
-    SOPS_AGE_KEY,
-)
-from qrt_pre_commit_hooks._enums import Index, Package
-from qrt_pre_commit_hooks._settings import SETTINGS
-from qrt_pre_commit_hooks._utilities import yield_add_hooks_args
-
-__version__ = "0.5.25"
-
-
-set_up_logging(__name__, files=".logs", log_version=__version__)
-sys.excepthook = make_except_hook(
-    path_max_age=MONTH, path=".logs/errors", version=__version__, pudb=is_debug
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from qrt_pre_commit_hooks._version import __version__ as __version__
+
+if TYPE_CHECKING:
+    from qrt_pre_commit_hooks._click import (
+        index_req_option,
+        package_option,
+        package_req_option,
+    )
+    from qrt_pre_commit_hooks._constants import (
+        ACTION_TOKEN,
+        DOCKERFILE,
+        GITEA_READ_TOKEN,
+        GITEA_READ_WRITE_TOKEN,
+        NANODE_PYPI_PASSWORD,
+        QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL,
+        ROOT_PEM,
+        SOPS_AGE_KEY,
+    )
+    from qrt_pre_commit_hooks._enums import Index, Package
+    from qrt_pre_commit_hooks._pre_commit_config import (
+        get_hook_args,
+        get_python_version,
+    )
+    from qrt_pre_commit_hooks._project import ProjectInfo, get_project_info
+    from qrt_pre_commit_hooks._settings import SETTINGS
+    from qrt_pre_commit_hooks._utilities import yield_add_hooks_args
+
+
+_MODULES: dict[str, str] = {
+    "ACTION_TOKEN": "_constants",
+    "DOCKERFILE": "_constants",
+    "GITEA_READ_TOKEN": "_constants",
+    "GITEA_READ_WRITE_TOKEN": "_constants",
+    "NANODE_PYPI_PASSWORD": "_constants",
+    "QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL": "_constants",
+    "ROOT_PEM": "_constants",
+    "SETTINGS": "_settings",
+    "SOPS_AGE_KEY": "_constants",
+    "Index": "_enums",
+    "Package": "_enums",
+    "ProjectInfo": "_project",
+    "get_hook_args": "_pre_commit_config",
+    "get_project_info": "_project",
+    "get_python_version": "_pre_commit_config",
+    "index_req_option": "_click",
+    "package_option": "_click",
+    "package_req_option": "_click",
+    "yield_add_hooks_args": "_utilities",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    return getattr(import_module(f"{__name__}.{module}"), name)
 
 
 __all__ = [
@@ -46,6 +75,10 @@ __all__ = [
     "SOPS_AGE_KEY",
     "Index",
     "Package",
+    "ProjectInfo",
+    "get_hook_args",
+    "get_project_info",
+    "get_python_version",
     "index_req_option",
     "package_option",
     "package_req_option",
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from re import escape, fullmatch
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(kw_only=True, slots=True)
+class UnterminatedBlockError(ValueError):
+    name: str
+
+    @override
+    def __str__(self) -> str:
+        return f"Managed block {self.name!r} has no end marker"
+
+
+def get_block_markers(name: str, /, *, comment: str = "#") -> tuple[str, str]:
+    return f"{comment} >>> qrt:{name}", f"{comment} <<< qrt:{name}"
+
+
+def get_blocks(text: str, /, *, comment: str = "#") -> dict[str, str]:
+    blocks: dict[str, str] = {}
+    name: str | None = None
+    lines: list[str] = []
+    for line in text.splitlines(keepends=True):
+        if name is None:
+            if (start := _match_marker(line, ">>>", comment=comment)) is not None:
+                name, lines = start, []
+        elif _match_marker(line, "<<<", comment=comment) == name:
+            _ = blocks.setdefault(name, "".join(lines))
+            name = None
+        else:
+            lines.append(line)
+    if name is not None:
+        raise UnterminatedBlockError(name=name)
+    return blocks
+
+
+def set_blocks(
+    text: str,
+    blocks: Mapping[str, str | None],
+    /,
+    *,
+    comment: str = "#",
+    prepend: bool = False,
+) -> str:
+    out: list[str] = []
+    done: set[str] = set()
+    name: str | None = None
+    for line in text.splitlines(keepends=True):
+        if name is None:
+            start = _match_marker(line, ">>>", comment=comment)
+            if (start is not None) and (start in blocks):
+                name = start
+            else:
+                out.append(line)
+        elif _match_marker(line, "<<<", comment=comment) == name:
+            body = blocks[name]
+            if (body is not None) and (name not in done):
+                out.append(_render_block(name, body, comment=comment))
+            elif (len(out) >= 1) and (out[-1] == "\n"):
+                _ = out.pop()  # the separator before the removed block
+            done.add(name)
+            name = None
+    if name is not None:
+        raise UnterminatedBlockError(name=name)
+    result = "".join(out)
+    new = [
+        _render_block(n, b, comment=comment)
+        for n, b in blocks.items()
+        if (b is not None) and (n not in done)
+    ]
+    if len(new) == 0:
+        return result
+    if prepend:
+        rest = result.lstrip("\n")
+        return "\n".join(new) + (f"\n{rest}" if rest != "" else "")
+    head = result.rstrip("\n")
+    return (f"{head}\n\n" if head != "" else "") + "\n".join(new)
+
+
+def _match_marker(line: str, arrows: str, /, *, comment: str = "#") -> str | None:
+    pattern = rf"{escape(comment)} {arrows} qrt:(\S+)\s*"
+    match = fullmatch(pattern, line)
+    return None if match is None else match.group(1)
+
+
+def _render_block(name: str, body: str, /, *, comment: str = "#") -> str:
+    start, end = get_block_markers(name, comment=comment)
+    body_use = body if (body == "") or body.endswith("\n") else f"{body}\n"
+    return f"{start}\n{body_use}{end}\n"
+
+
+__all__ = ["UnterminatedBlockError", "get_block_markers", "get_blocks", "set_blocks"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sys
+from hashlib import sha256
+from importlib.util import cache_from_source
+from json import loads
+from pathlib import Path
+from py_compile import PycInvalidationMode
+from py_compile import compile as compile_py
+from shutil import copy2, copytree, ignore_patterns
+from subprocess import check_output
+from sysconfig import get_platform
+from tempfile import TemporaryDirectory
+from zipapp import create_archive
+
+from qrt_pre_commit_hooks._constants import HOOK_MODULES
+
+BUNDLE_DIR = Path("bundle")
+_PACKAGE = "qrt_pre_commit_hooks"
+_DIST = "qrt-pre-commit-hooks"
+_COLLECT = """
+import json, sys
+from importlib import import_module
+from importlib.metadata import distribution, packages_distributions
+
+for module in sys.argv[2:]:
+    import_module(module)
+tops = {name.partition(".")[0] for name in sys.modules}
+mapping = packages_distributions()
+dists = sorted({d for t in tops for d in mapping.get(t, []) if d != sys.argv[1]})
+files = []
+for name in dists:
+    for file in distribution(name).files or []:
+        files.append([str(file), str(file.locate())])
+print(json.dumps(files))
+"""
+_MAIN = """
+import os
+import sys
+from pathlib import Path
+from shutil import rmtree
+from zipfile import ZipFile
+
+DIGEST = {digest!r}
+
+
+def _extract() -> Path:
+    root = os.environ.get("XDG_CACHE_HOME", "") or Path.home() / ".cache"
+    target = Path(root, "qrt-pre-commit-hooks", "bundle", DIGEST)
+    if target.is_dir():
+        return target
+    temp = target.with_name(f"{{DIGEST}}.{{os.getpid()}}")
+    with ZipFile(Path(__file__).parent) as zip_:
+        for name in zip_.namelist():
+            if name.startswith("site/") and not name.endswith("/"):
+                path = temp / name.removeprefix("site/")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _ = path.write_bytes(zip_.read(name))
+    try:
+        temp.rename(target)
+    except OSError:  # another invocation got there first
+        rmtree(temp, ignore_errors=True)
+    return target
+
+
+site = str(_extract())
+sys.path.insert(0, site)
+os.environ["PYTHONPATH"] = os.pathsep.join(
+    p for p in [site, os.environ.get("PYTHONPATH", "")] if p != ""
+)
+hook = sys.argv.pop(1)
+sys.argv[0] = hook
+
+from qrt_pre_commit_hooks._client import main
+
+main(hook)
+"""
+
+
+def build_bundle(output: Path = BUNDLE_DIR, /) -> Path:
+    with TemporaryDirectory() as temp:
+        site = Path(temp, "site")
+        _ = copytree(
+            Path(__file__).parent,
+            site / _PACKAGE,
+            ignore=ignore_patterns("__pycache__", "*.pyc"),
+        )
+        for rel, src in _collect_files():
+            if rel.startswith("..") or ("__pycache__" in rel) or rel.endswith(".pyc"):
+                continue
+            dest = site / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            _ = copy2(src, dest)
+        _compile_all(site)
+        _ = Path(temp, "__main__.py").write_text(
+            _MAIN.lstrip().format(digest=_get_digest(site))
+        )
+        output.mkdir(parents=True, exist_ok=True)
+        path = output / f"qrt-hooks-{get_bundle_tag()}.pyz"
+        create_archive(temp, path, compressed=True)
+    return path
+
+
+def get_bundle_tag() -> str:
+    platform = get_platform().replace("-", "_").replace(".", "_")
+    return f"cp{sys.version_info.major}{sys.version_info.minor}-{platform}"
+
+
+def _collect_files() -> list[tuple[str, Path]]:
+    modules = [f"{_PACKAGE}._client", f"{_PACKAGE}._server", *HOOK_MODULES.values()]
+    output = check_output([sys.executable, "-c", _COLLECT, _DIST, *modules], text=True)
+    return [(rel, Path(src)) for rel, src in loads(output)]
+
+
+def _compile_all(site: Path, /) -> None:
+    for path in sorted(site.rglob("*.py")):
+        _ = compile_py(
+            str(path),
+            cfile=cache_from_source(str(path)),
+            dfile=str(path.relative_to(site)),
+            doraise=True,
+            invalidation_mode=PycInvalidationMode.UNCHECKED_HASH,
+        )
+
+
+def _get_digest(site: Path, /) -> str:
+    hasher = sha256()
+    for path in sorted(p for p in site.rglob("*") if p.is_file()):
+        hasher.update(str(path.relative_to(site)).encode())
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()[:16]
+
+
+__all__ = ["BUNDLE_DIR", "build_bundle", "get_bundle_tag"]
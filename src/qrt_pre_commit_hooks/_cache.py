@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from hashlib import sha256
+from json import dumps
+from os import environ
+from typing import TYPE_CHECKING, Any
+
+from qrt_pre_commit_hooks._settings import get_settings_key
+from qrt_pre_commit_hooks._spans import yield_span
+from qrt_pre_commit_hooks._storage import get_cache_dir, get_file_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from utilities.types import PathLike
+
+
+NO_CACHE_ENV_VAR = "QRT_PRE_COMMIT_HOOKS_NO_CACHE"
+MAX_RESULTS = 1024
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CachedRun:
+    hook: str
+    func: Callable[[], bool]
+    args: list[Any] = field(default_factory=list)
+    paths: list[PathLike] = field(default_factory=list)
+
+    def __call__(self) -> bool:
+        path = self.paths[0] if len(self.paths) >= 1 else None
+        with yield_span("run", hook=self.hook, path=path) as span:
+            if not is_cache_enabled():
+                return self.func()
+            key = get_result_key(self.hook, args=self.args, paths=self.paths)
+            marker = get_cache_dir() / "results" / key
+            if marker.exists():
+                marker.touch()  # mark as recently used
+                if span is not None:
+                    span.cached = True
+                return True
+            result = self.func()
+            if result:
+                _record_result(marker)
+            return result
+
+
+def cached_run(
+    hook: str,
+    func: Callable[[], bool],
+    /,
+    *,
+    args: Iterable[Any] = (),
+    paths: Iterable[PathLike] = (),
+) -> CachedRun:
+    return CachedRun(hook=hook, func=func, args=list(args), paths=list(paths))
+
+
+def get_result_key(
+    hook: str, /, *, args: Iterable[Any] = (), paths: Iterable[PathLike] = ()
+) -> str:
+    parts = [hook, *map(str, args), *map(get_file_hash, paths), get_settings_key()]
+    return sha256(dumps(parts).encode()).hexdigest()
+
+
+def is_cache_enabled() -> bool:
+    return environ.get(NO_CACHE_ENV_VAR, "") in {"", "0"}
+
+
+def _record_result(path: Path, /) -> None:
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.touch()
+        entries = list(path.parent.iterdir())
+        if len(entries) > MAX_RESULTS:
+            entries.sort(key=lambda p: p.stat().st_mtime_ns)
+            for entry in entries[: len(entries) - MAX_RESULTS]:
+                entry.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+__all__ = [
+    "MAX_RESULTS",
+    "NO_CACHE_ENV_VAR",
+    "CachedRun",
+    "cached_run",
+    "get_result_key",
+    "is_cache_enabled",
+]
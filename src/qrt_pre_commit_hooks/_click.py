@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from utilities.click import Enum, option
+from utilities.click import Enum, flag, option
 
 from qrt_pre_commit_hooks._enums import Index, Package
 
+check_option = flag("--check", default=False)
+discover_option = flag("--discover", default=False)
 index_req_option = option(
     "--index", type=Enum(Index), required=True, help="The package index"
 )
+jobs_option = option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="The number of worker threads for independent paths; 0 for one per CPU",
+)
 package_option = option(
     "--package", type=Enum(Package), default=None, help="The package type"
 )
@@ -15,4 +23,11 @@ package_req_option = option(
 )
 
 
-__all__ = ["index_req_option", "package_option", "package_req_option"]
+__all__ = [
+    "check_option",
+    "discover_option",
+    "index_req_option",
+    "jobs_option",
+    "package_option",
+    "package_req_option",
+]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import sys
+from hashlib import sha256
+from importlib import import_module
+from json import dumps, loads
+from os import environ, getuid
+from pathlib import Path
+from socket import AF_UNIX, SHUT_WR, SOCK_STREAM, socket
+from stat import S_ISSOCK
+from subprocess import DEVNULL, Popen
+from tempfile import gettempdir
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from qrt_pre_commit_hooks._constants import HOOK_MODULES
+from qrt_pre_commit_hooks._version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from utilities.types import PathLike
+
+
+SERVER_ENV_VAR = "QRT_PRE_COMMIT_HOOKS_SERVER"
+SOCKET_NAME = "qrt-hooks.sock"
+_ENV_NAMES = {"HOME", "PATH"}
+_ENV_PREFIXES = ("QRT_PRE_COMMIT_HOOKS_", "XDG_")
+_ENV_SETTINGS_PREFIXES = (  # the `_Settings` fields, as in `get_settings_key`
+    "ci",
+    "configs",
+    "gitea",
+    "indexes",
+    "packages",
+)
+_MAX_SOCKET_PATH = 100  # sun_path is 104-108 bytes depending on the platform
+
+
+class Response(NamedTuple):
+    exit_code: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+
+def get_request_env(env: Mapping[str, str] | None = None, /) -> dict[str, str]:
+    env_use = environ if env is None else env
+    return {k: v for k, v in env_use.items() if is_request_env_var(k)}
+
+
+def get_socket_path(cwd: PathLike | None = None, /) -> Path:
+    cwd_use = (Path.cwd() if cwd is None else Path(cwd)).resolve()
+    root = cwd_use
+    for dir_ in [cwd_use, *cwd_use.parents]:
+        if (dir_ / ".git").is_dir():
+            path = dir_ / ".git" / SOCKET_NAME
+            if len(str(path)) <= _MAX_SOCKET_PATH:
+                return path
+            root = dir_
+            break
+    digest = sha256(str(root).encode()).hexdigest()[:16]
+    return _get_runtime_dir() / f"qrt-hooks-{digest}.sock"
+
+
+def is_private_dir(path: PathLike, /) -> bool:
+    try:
+        result = Path(path).stat()
+    except OSError:
+        return False
+    return (result.st_uid == getuid()) and (result.st_mode & 0o022 == 0)
+
+
+def is_request_env_var(name: str, /) -> bool:
+    return (
+        (name in _ENV_NAMES)
+        or name.startswith(_ENV_PREFIXES)
+        or name.lower().startswith(_ENV_SETTINGS_PREFIXES)
+    )
+
+
+def main(hook: str, /) -> None:
+    mode = environ.get(SERVER_ENV_VAR, "")
+    if mode != "0":
+        response = request(hook, sys.argv[1:])
+        if response is not None:
+            _ = sys.stdout.write(response.stdout)
+            _ = sys.stderr.write(response.stderr)
+            sys.exit(response.exit_code)
+        if mode == "1":
+            start_server()
+    import_module(HOOK_MODULES[hook]).cli(prog_name=hook)
+
+
+def request(
+    hook: str, argv: Iterable[str], /, *, path: PathLike | None = None
+) -> Response | None:
+    path_use = get_socket_path() if path is None else Path(path)
+    if not _is_private_socket(path_use):
+        return None
+    payload = {
+        "version": __version__,
+        "hook": hook,
+        "argv": list(argv),
+        "cwd": str(Path.cwd()),
+        "env": get_request_env(),
+    }
+    try:
+        with socket(AF_UNIX, SOCK_STREAM) as sock:
+            sock.connect(str(path_use))
+            sock.sendall(dumps(payload).encode() + b"\n")
+            sock.shutdown(SHUT_WR)
+            data = b"".join(iter(lambda: sock.recv(65536), b""))
+        response: Any = loads(data)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(response, dict)) or response.get("stale", False):
+        return None
+    return Response(**response)
+
+
+def start_server() -> None:
+    _ = Popen(
+        [sys.executable, "-m", "qrt_pre_commit_hooks._server"],
+        stdin=DEVNULL,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _get_entry(hook: str, /) -> Callable[[], None]:
+    def entry() -> None:
+        main(hook)
+
+    return entry
+
+
+def _get_runtime_dir() -> Path:
+    runtime = environ.get("XDG_RUNTIME_DIR", "")
+    if runtime != "":
+        return Path(runtime)
+    return Path(gettempdir(), f"qrt-hooks-{getuid()}")
+
+
+def _is_private_socket(path: Path, /) -> bool:
+    try:
+        result = path.lstat()
+    except OSError:
+        return False
+    return (
+        S_ISSOCK(result.st_mode)
+        and (result.st_uid == getuid())
+        and is_private_dir(path.parent)
+    )
+
+
+add_qrt_hooks = _get_entry("add-qrt-hooks")
+modify_ci_push = _get_entry("modify-ci-push")
+modify_direnv = _get_entry("modify-direnv")
+modify_pre_commit = _get_entry("modify-pre-commit")
+modify_pyproject = _get_entry("modify-pyproject")
+setup_docker = _get_entry("setup-docker")
+
+
+__all__ = [
+    "SERVER_ENV_VAR",
+    "SOCKET_NAME",
+    "Response",
+    "add_qrt_hooks",
+    "get_request_env",
+    "get_socket_path",
+    "is_private_dir",
+    "is_request_env_var",
+    "main",
+    "modify_ci_push",
+    "modify_direnv",
+    "modify_pre_commit",
+    "modify_pyproject",
+    "request",
+    "setup_docker",
+    "start_server",
+]
@@ -9,8 +9,22 @@ NANODE_PYPI_PASSWORD = "${{secrets.NANODE_PYPI_PASSWORD}}"  # noqa: S105
 SOPS_AGE_KEY = "${{secrets.SOPS_AGE_KEY}}"
 
 
+DEBIAN_VERSION = "trixie"
 DOCKERFILE = Path("docker/Dockerfile")
+DOCKERIGNORE = Path(".dockerignore")
+GITEA_PULL_REQUEST_YAML = Path(".gitea/workflows/pull-request.yaml")
 ROOT_PEM = Path("docker/root.pem")
+SETTINGS_TOML = Path("settings.toml")
+
+
+HOOK_MODULES: dict[str, str] = {
+    "add-qrt-hooks": "qrt_pre_commit_hooks.hooks._add_qrt_hooks",
+    "modify-pre-commit": "qrt_pre_commit_hooks.hooks._modify_pre_commit",
+    "modify-ci-push": "qrt_pre_commit_hooks.hooks._modify_ci_push",
+    "modify-direnv": "qrt_pre_commit_hooks.hooks._modify_direnv",
+    "modify-pyproject": "qrt_pre_commit_hooks.hooks._modify_pyproject",
+    "setup-docker": "qrt_pre_commit_hooks.hooks._setup_docker",
+}
 
 
 QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL = (
@@ -20,11 +34,16 @@ QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL = (
 
 __all__ = [
     "ACTION_TOKEN",
+    "DEBIAN_VERSION",
     "DOCKERFILE",
+    "DOCKERIGNORE",
+    "GITEA_PULL_REQUEST_YAML",
     "GITEA_READ_TOKEN",
     "GITEA_READ_WRITE_TOKEN",
+    "HOOK_MODULES",
     "NANODE_PYPI_PASSWORD",
     "QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL",
     "ROOT_PEM",
+    "SETTINGS_TOML",
     "SOPS_AGE_KEY",
 ]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from os import scandir
+from pathlib import Path
+from tomllib import TOMLDecodeError
+from typing import TYPE_CHECKING, Any
+
+from pre_commit_hooks.constants import PYPROJECT_TOML
+from pre_commit_hooks.utilities import merge_paths
+
+from qrt_pre_commit_hooks._project import get_project_info
+from qrt_pre_commit_hooks._toml import read_toml
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from utilities.types import PathLike
+
+    from qrt_pre_commit_hooks._enums import Package
+
+
+SKIP_DIRS: frozenset[str] = frozenset({".git", ".venv", "node_modules"})
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _IgnoreRule:
+    base: Path
+    pattern: str
+    negate: bool = False
+    dir_only: bool = False
+    anchored: bool = False
+
+    def match(self, path: Path, /, *, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.anchored:
+            return fnmatchcase(path.relative_to(self.base).as_posix(), self.pattern)
+        return fnmatchcase(path.name, self.pattern)
+
+
+def discover_members(root: PathLike | None = None, /) -> list[Path]:
+    root_use = (Path.cwd() if root is None else Path(root)).resolve()
+    members = _get_uv_members(root_use)
+    if members is None:
+        members = [p.parent for p in _walk(root_use) if p.name == PYPROJECT_TOML.name]
+    return sorted(set(members))
+
+
+def discover_paths(target: PathLike, /, *, root: PathLike | None = None) -> list[Path]:
+    name = Path(target).name
+    return [p for m in discover_members(root) if (p := m / name).is_file()]
+
+
+def get_member_package(member: PathLike, /) -> Package | None:
+    return get_project_info(member).package
+
+
+def merge_member_paths(
+    *paths: PathLike, target: PathLike, root: PathLike | None = None
+) -> list[Path]:
+    mapped = merge_paths(*paths, target=target)
+    discovered = discover_paths(target, root=root)
+    return list(dict.fromkeys(p.resolve() for p in [*mapped, *discovered]))
+
+
+def _get_uv_members(root: Path, /) -> list[Path] | None:
+    try:
+        doc = read_toml(root / PYPROJECT_TOML) or {}
+    except TOMLDecodeError:
+        return None
+    workspace: Any = doc.get("tool", {}).get("uv", {}).get("workspace")
+    if not isinstance(workspace, dict):
+        return None
+    excluded = {p for g in workspace.get("exclude", []) for p in root.glob(g)}
+    return [
+        root,
+        *(
+            path
+            for glob in workspace.get("members", [])
+            for path in root.glob(glob)
+            if (path not in excluded) and (path / PYPROJECT_TOML.name).is_file()
+        ),
+    ]
+
+
+def _walk(root: Path, /) -> Iterator[Path]:
+    stack: list[tuple[Path, list[_IgnoreRule]]] = [(root, [])]
+    while len(stack) >= 1:
+        dir_, rules = stack.pop()
+        rules_use = [*rules, *_read_gitignore(dir_)]
+        with scandir(dir_) as entries:
+            for entry in entries:
+                path = Path(entry.path)
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if (is_dir and (entry.name in SKIP_DIRS)) or _is_ignored(
+                    path, rules_use, is_dir=is_dir
+                ):
+                    continue
+                if is_dir:
+                    stack.append((path, rules_use))
+                elif entry.is_file():
+                    yield path
+
+
+def _is_ignored(path: Path, rules: list[_IgnoreRule], /, *, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:  # the last matching rule wins
+        if rule.match(path, is_dir=is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def _read_gitignore(dir_: Path, /) -> list[_IgnoreRule]:
+    try:
+        text = (dir_ / ".gitignore").read_text()
+    except FileNotFoundError:
+        return []
+    rules: list[_IgnoreRule] = []
+    for line in text.splitlines():
+        pattern = line.strip()
+        if (pattern == "") or pattern.startswith("#"):
+            continue
+        negate = pattern.startswith("!")
+        pattern = pattern.removeprefix("!")
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        rules.append(
+            _IgnoreRule(
+                base=dir_,
+                pattern=pattern.lstrip("/"),
+                negate=negate,
+                dir_only=dir_only,
+                anchored=anchored,
+            )
+        )
+    return rules
+
+
+__all__ = [
+    "SKIP_DIRS",
+    "discover_members",
+    "discover_paths",
+    "get_member_package",
+    "merge_member_paths",
+]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from contextlib import chdir
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import TYPE_CHECKING, override
+
+from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML
+from pre_commit_hooks.utilities import run_all
+
+from qrt_pre_commit_hooks._constants import (
+    HOOK_MODULES,
+    QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL,
+)
+from qrt_pre_commit_hooks._pre_commit_config import get_repo_hooks_args
+from qrt_pre_commit_hooks._workspace import yield_workspace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from utilities.types import PathLike
+
+    from qrt_pre_commit_hooks._workspace import Workspace
+
+
+HOOKS: tuple[str, ...] = tuple(HOOK_MODULES)
+MAX_ITERATIONS = 10
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CheckResult:
+    results: dict[str, bool] = field(default_factory=dict)
+    diff: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return all(self.results.values())
+
+
+def check_hooks(
+    root: PathLike | None = None, /, *, hooks: Iterable[str] | None = None
+) -> CheckResult:
+    with yield_workspace(root, write=False) as workspace:
+        results = _run_hooks(workspace, hooks=hooks)
+        return CheckResult(results=results, diff=workspace.get_diff())
+
+
+def converge_hooks(
+    root: PathLike | None = None,
+    /,
+    *,
+    max_iterations: int = MAX_ITERATIONS,
+    write: bool = True,
+) -> list[dict[str, bool]]:
+    with yield_workspace(root, write=write) as workspace:
+        path = workspace.stage / PRE_COMMIT_CONFIG_YAML
+        seen = {workspace.get_digest()}
+        passes: list[dict[str, bool]] = []
+        for _ in range(max_iterations):
+            results = {"add-qrt-hooks": run_hook("add-qrt-hooks", root=workspace.stage)}
+            hooks = set(get_hooks_args(path)) - {"add-qrt-hooks"}
+            results.update(_run_hooks(workspace, hooks=hooks))
+            passes.append(results)
+            if all(results.values()):
+                return passes
+            digest = workspace.get_digest()
+            if digest in seen:
+                raise ConvergeCycleError(iterations=len(passes))
+            seen.add(digest)
+    raise ConvergeLimitError(iterations=max_iterations)
+
+
+@dataclass(kw_only=True, slots=True)
+class ConvergeError(RuntimeError):
+    iterations: int
+
+
+@dataclass(kw_only=True, slots=True)
+class ConvergeCycleError(ConvergeError):
+    @override
+    def __str__(self) -> str:
+        return f"Hooks cycled back to an earlier state after {self.iterations} pass(es)"
+
+
+@dataclass(kw_only=True, slots=True)
+class ConvergeLimitError(ConvergeError):
+    @override
+    def __str__(self) -> str:
+        return f"Hooks failed to converge within {self.iterations} pass(es)"
+
+
+def get_hooks_args(path: PathLike = PRE_COMMIT_CONFIG_YAML, /) -> dict[str, list[str]]:
+    args = get_repo_hooks_args(QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL, path=path)
+    return {k: v for k, v in args.items() if k in HOOK_MODULES}
+
+
+def run_hook(hook: str, /, *, root: PathLike, args: Iterable[str] = ()) -> bool:
+    module = import_module(HOOK_MODULES[hook])
+    context = module.cli.make_context(hook, [str(PRE_COMMIT_CONFIG_YAML), *args])
+    params = {k: v for k, v in context.params.items() if k not in {"check", "jobs"}}
+    with chdir(root):  # hooks resolve their targets against the working directory
+        return run_all(*module._get_funcs(**params))  # noqa: SLF001
+
+
+def run_hooks(
+    root: PathLike | None = None,
+    /,
+    *,
+    hooks: Iterable[str] | None = None,
+    write: bool = True,
+) -> dict[str, bool]:
+    with yield_workspace(root, write=write) as workspace:
+        return _run_hooks(workspace, hooks=hooks)
+
+
+def _run_hooks(
+    workspace: Workspace, /, *, hooks: Iterable[str] | None = None
+) -> dict[str, bool]:
+    path = workspace.stage / PRE_COMMIT_CONFIG_YAML
+    results: dict[str, bool] = {}
+    for hook in HOOKS:
+        args = get_hooks_args(path)  # add-qrt-hooks may have added hooks
+        if hook in (set(args) if hooks is None else set(hooks)):
+            results[hook] = run_hook(
+                hook, root=workspace.stage, args=args.get(hook, [])
+            )
+    return results
+
+
+__all__ = [
+    "HOOKS",
+    "MAX_ITERATIONS",
+    "CheckResult",
+    "ConvergeCycleError",
+    "ConvergeError",
+    "ConvergeLimitError",
+    "check_hooks",
+    "converge_hooks",
+    "get_hooks_args",
+    "run_hook",
+    "run_hooks",
+]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.utilities import run_all_maybe_raise
+
+from qrt_pre_commit_hooks._cache import CachedRun
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+def get_target(func: Callable[[], bool], /) -> Path | None:
+    if isinstance(func, CachedRun) and (len(func.paths) >= 1):
+        return Path(func.paths[0]).resolve()
+    return None
+
+
+def run_funcs(funcs: Iterable[Callable[[], bool]], /, *, jobs: int = 1) -> None:
+    funcs_use = list(funcs)
+    if (jobs == 1) or (len(funcs_use) <= 1):
+        run_all_maybe_raise(*funcs_use)
+        return
+    outcomes = run_parallel(funcs_use, jobs=jobs)
+    run_all_maybe_raise(*(partial(_replay, o) for o in outcomes))
+
+
+def run_parallel(
+    funcs: Iterable[Callable[[], bool]], /, *, jobs: int = 0
+) -> list[bool | Exception]:
+    funcs_use = list(funcs)
+    groups: dict[Path | None, list[int]] = {}
+    for i, func in enumerate(funcs_use):
+        groups.setdefault(get_target(func), []).append(i)
+    outcomes: list[bool | Exception] = [False] * len(funcs_use)
+
+    def run_group(indices: list[int], /) -> None:
+        for i in indices:  # work on the same file runs in order
+            try:
+                outcomes[i] = funcs_use[i]()
+            except Exception as error:  # noqa: BLE001
+                outcomes[i] = error
+
+    with ThreadPoolExecutor(max_workers=None if jobs <= 0 else jobs) as pool:
+        futures = [
+            pool.submit(copy_context().run, run_group, indices)
+            for indices in groups.values()
+        ]
+        for future in futures:
+            future.result()
+    return outcomes
+
+
+def _replay(outcome: bool | Exception, /) -> bool:  # noqa: FBT001
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+__all__ = ["get_target", "run_funcs", "run_parallel"]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum, unique
+from functools import partial
+from pathlib import Path
+from traceback import format_exc
+from typing import TYPE_CHECKING
+
+from qrt_pre_commit_hooks._dispatch import run_hooks
+from qrt_pre_commit_hooks._settings import SETTINGS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@unique
+class FleetStatus(StrEnum):
+    conformant = "conformant"
+    modified = "modified"
+    error = "error"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FleetResult:
+    repo: Path
+    status: FleetStatus
+    hooks: dict[str, bool] = field(default_factory=dict)
+    traceback: Path | None = None
+
+
+def get_fleet_repos(
+    *, dir_: Path | None = None, base: Path | None = None
+) -> list[Path]:
+    repos: list[Path] = []
+    if dir_ is not None:
+        repos.extend(p for p in sorted(dir_.iterdir()) if (p / ".git").exists())
+    if base is not None:
+        names = sorted(SETTINGS.registry.types)
+        repos.extend(p for n in names if (p := base / n).is_dir())
+    return repos
+
+
+def run_fleet(
+    repos: Iterable[Path],
+    /,
+    *,
+    jobs: int | None = None,
+    dry_run: bool = False,
+    logs: Path | None = None,
+) -> list[FleetResult]:
+    logs_use = (Path(".logs/fleet") if logs is None else logs).resolve()
+    func = partial(_run_repo, dry_run=dry_run, logs=logs_use)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(func, repos))
+
+
+def _run_repo(repo: Path, /, *, dry_run: bool = False, logs: Path) -> FleetResult:
+    try:
+        hooks = run_hooks(repo, write=not dry_run)
+    except Exception:  # noqa: BLE001
+        path = logs / f"{repo.name}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ = path.write_text(format_exc())
+        return FleetResult(repo=repo, status=FleetStatus.error, traceback=path)
+    status = FleetStatus.conformant if all(hooks.values()) else FleetStatus.modified
+    return FleetResult(repo=repo, status=status, hooks=hooks)
+
+
+__all__ = ["FleetResult", "FleetStatus", "get_fleet_repos", "run_fleet"]
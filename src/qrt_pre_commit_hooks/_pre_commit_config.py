@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+from re import search
+from typing import TYPE_CHECKING, Any
+
+from pre_commit_hooks.constants import DYCW_PRE_COMMIT_HOOKS_URL, PRE_COMMIT_CONFIG_YAML
+from yaml import load
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
+if TYPE_CHECKING:
+    from utilities.types import PathLike, StrDict
+
+
+_CACHE: dict[Path, tuple[tuple[int, int], StrDict]] = {}
+
+
+def get_hook_args(
+    repo: str, hook: str, /, *, path: PathLike = PRE_COMMIT_CONFIG_YAML
+) -> list[str] | None:
+    return get_repo_hooks_args(repo, path=path).get(hook)
+
+
+def get_python_version(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> str | None:
+    args = get_hook_args(DYCW_PRE_COMMIT_HOOKS_URL, "add-hooks", path=path) or []
+    for arg in args:
+        if (match := search(r"^--python-version=(\d+\.\d+)$", arg)) is not None:
+            return match.group(1)
+    return None
+
+
+def get_repo_hooks_args(
+    repo: str, /, *, path: PathLike = PRE_COMMIT_CONFIG_YAML
+) -> dict[str, list[str]]:
+    args: dict[str, list[str]] = {}
+    for repo_i in _get_list(_load_cached(path).get("repos")):
+        if isinstance(repo_i, dict) and (repo_i.get("repo") == repo):
+            for hook in _get_list(repo_i.get("hooks")):
+                if isinstance(hook, dict) and isinstance(id_ := hook.get("id"), str):
+                    args[id_] = [str(a) for a in _get_list(hook.get("args"))]
+    return args
+
+
+def load_config(path: PathLike = PRE_COMMIT_CONFIG_YAML, /) -> StrDict:
+    return deepcopy(_load_cached(path))
+
+
+def _get_list(value: Any, /) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _load_cached(path: PathLike, /) -> StrDict:
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _ = _CACHE.pop(path, None)
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+    try:
+        cached_key, config = _CACHE[path]
+    except KeyError:
+        pass
+    else:
+        if cached_key == key:
+            return config
+    with path.open(mode="rb") as fh:
+        loaded: Any = load(fh, Loader=SafeLoader)
+    config = loaded if isinstance(loaded, dict) else {}
+    _CACHE[path] = (key, config)
+    return config
+
+
+__all__ = ["get_hook_args", "get_python_version", "get_repo_hooks_args", "load_config"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML, PYPROJECT_TOML
+
+from qrt_pre_commit_hooks._pre_commit_config import get_python_version
+from qrt_pre_commit_hooks._settings import SETTINGS, get_settings_key
+from qrt_pre_commit_hooks._toml import get_project
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from utilities.types import PathLike
+
+    from qrt_pre_commit_hooks._enums import Package
+
+
+_CACHE: dict[Path, tuple[tuple[str | tuple[int, int] | None, ...], ProjectInfo]] = {}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ProjectInfo:
+    root: Path
+    name: str | None = None
+    scripts: Mapping[str, str] = field(default_factory=dict)
+    dependencies: tuple[str, ...] = ()
+    package: Package | None = None
+    python_version: str | None = None
+
+    @property
+    def need_docker(self) -> bool:
+        return (self.name is not None) and (f"{self.name}-cli" in self.scripts)
+
+
+def get_project_info(root: PathLike | None = None, /) -> ProjectInfo:
+    root_use = (Path.cwd() if root is None else Path(root)).resolve()
+    stats = (_stat(root_use / p) for p in [PYPROJECT_TOML, PRE_COMMIT_CONFIG_YAML])
+    key = (get_settings_key(), *stats)
+    try:
+        cached_key, info = _CACHE[root_use]
+    except KeyError:
+        pass
+    else:
+        if cached_key == key:
+            return info
+    info = _build(root_use)
+    _CACHE[root_use] = (key, info)
+    return info
+
+
+def _build(root: Path, /) -> ProjectInfo:
+    project = get_project(root / PYPROJECT_TOML)
+    name = project.get("name")
+    name_use = name if isinstance(name, str) else None
+    scripts = project.get("scripts")
+    dependencies = project.get("dependencies")
+    return ProjectInfo(
+        root=root,
+        name=name_use,
+        scripts=dict(scripts) if isinstance(scripts, dict) else {},
+        dependencies=tuple(dependencies) if isinstance(dependencies, list) else (),
+        package=None if name_use is None else SETTINGS.registry.get(name_use),
+        python_version=get_python_version(path=root / PRE_COMMIT_CONFIG_YAML),
+    )
+
+
+def _stat(path: Path, /) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+__all__ = ["ProjectInfo", "get_project_info"]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+import sys
+from contextlib import chdir, contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from importlib import import_module
+from io import StringIO
+from json import dumps, loads
+from os import environ
+from pathlib import Path
+from socket import AF_UNIX, SOCK_STREAM, socket
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TextIO, override
+
+from qrt_pre_commit_hooks._client import (
+    Response,
+    get_request_env,
+    get_socket_path,
+    is_private_dir,
+    is_request_env_var,
+)
+from qrt_pre_commit_hooks._constants import HOOK_MODULES
+from qrt_pre_commit_hooks._settings import get_settings_key
+from qrt_pre_commit_hooks._utilities import set_up_cli
+from qrt_pre_commit_hooks._version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from utilities.types import PathLike
+
+
+IDLE_TIMEOUT = 600.0
+_HOOKS = list(HOOK_MODULES)
+_LOCK = Lock()
+
+
+@dataclass(kw_only=True, slots=True)
+class UnsafeSocketDirError(Exception):
+    path: Path
+
+    @override
+    def __str__(self) -> str:
+        return f"Socket directory {str(self.path)!r} is not private to the current user"
+
+
+def run_request(hook: str, argv: Iterable[str], /) -> Response:
+    cli = import_module(HOOK_MODULES[hook]).cli
+    stdout, stderr = StringIO(), StringIO()
+    with _yield_captured(stdout, stderr):
+        try:
+            cli.main(args=list(argv), prog_name=hook)
+        except SystemExit as error:
+            exit_code = _get_exit_code(error.code)
+        except Exception as error:  # noqa: BLE001
+            sys.excepthook(type(error), error, error.__traceback__)
+            exit_code = 1
+        else:
+            exit_code = 0
+    return Response(
+        exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+    )
+
+
+def serve(*, path: PathLike | None = None, idle_timeout: float = IDLE_TIMEOUT) -> None:
+    set_up_cli()
+    for module in HOOK_MODULES.values():  # keep every hook warm
+        _ = import_module(module)
+    key = get_settings_key()
+    path_use = get_socket_path() if path is None else Path(path)
+    path_use.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not is_private_dir(path_use.parent):
+        raise UnsafeSocketDirError(path=path_use.parent)
+    path_use.unlink(missing_ok=True)  # replace a stale server
+    with socket(AF_UNIX, SOCK_STREAM) as server:
+        server.bind(str(path_use))
+        path_use.chmod(0o600)
+        inode = path_use.stat().st_ino
+        server.listen()
+        server.settimeout(idle_timeout)
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    return
+                with conn:
+                    conn.settimeout(None)
+                    if not _handle(conn, key=key):
+                        return
+        finally:
+            try:
+                if path_use.stat().st_ino == inode:
+                    path_use.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _handle(conn: socket, /, *, key: str) -> bool:
+    data = b"".join(iter(lambda: conn.recv(65536), b""))
+    try:
+        request: Any = loads(data)
+        version, hook, argv = request["version"], request["hook"], request["argv"]
+        cwd, env = request["cwd"], request["env"]
+    except (KeyError, TypeError, ValueError) as error:
+        _send_error(conn, f"Invalid request: {error!r}")
+        return True
+    if not (
+        (hook in _HOOKS)
+        and isinstance(argv, list)
+        and isinstance(cwd, str)
+        and isinstance(env, dict)
+    ):
+        _send_error(conn, f"Invalid request for hook {hook!r}")
+        return True
+    try:
+        with _yield_request_env(cwd, env):
+            if (version != __version__) or (get_settings_key() != key):
+                conn.sendall(dumps({"stale": True}).encode())
+                return False
+            response = run_request(hook, argv)
+    except OSError as error:  # e.g. the client's cwd no longer exists
+        _send_error(conn, str(error))
+        return True
+    conn.sendall(dumps(response._asdict()).encode())
+    return True
+
+
+def _get_exit_code(code: Any, /) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    _ = sys.stderr.write(f"{code}\n")
+    return 1
+
+
+def _get_stream_handlers() -> list[logging.StreamHandler[Any]]:
+    loggers = [
+        logging.getLogger(),
+        *(
+            logger
+            for logger in logging.root.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)
+        ),
+    ]
+    return [
+        handler
+        for logger in loggers
+        for handler in logger.handlers
+        if isinstance(handler, logging.StreamHandler)
+        and not isinstance(handler, logging.FileHandler)
+    ]
+
+
+def _send_error(conn: socket, message: str, /) -> None:
+    response = Response(exit_code=1, stderr=f"{message}\n")
+    conn.sendall(dumps(response._asdict()).encode())
+
+
+@contextmanager
+def _yield_captured(stdout: TextIO, stderr: TextIO, /) -> Iterator[None]:
+    swaps: dict[int, TextIO] = {id(sys.stdout): stdout, id(sys.stderr): stderr}
+    handlers = [h for h in _get_stream_handlers() if id(h.stream) in swaps]
+    streams = [h.stream for h in handlers]
+    for handler in handlers:
+        _ = handler.setStream(swaps[id(handler.stream)])
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            yield
+    finally:
+        for handler, stream in zip(handlers, streams, strict=True):
+            _ = handler.setStream(stream)
+
+
+@contextmanager
+def _yield_request_env(cwd: PathLike, env: Mapping[str, str], /) -> Iterator[None]:
+    with _LOCK:  # the environment and cwd are process-wide
+        saved = dict(environ)
+        for name in [n for n in environ if is_request_env_var(n)]:
+            del environ[name]
+        environ.update(get_request_env(env))
+        try:
+            with chdir(cwd):
+                yield
+        finally:
+            environ.clear()
+            environ.update(saved)
+
+
+__all__ = ["IDLE_TIMEOUT", "UnsafeSocketDirError", "run_request", "serve"]
+
+
+if __name__ == "__main__":
+    serve()
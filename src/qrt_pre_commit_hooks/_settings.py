@@ -1,11 +1,27 @@
 # ruff: noqa: TC002, TC003
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from functools import cache, cached_property
+from hashlib import sha256
+from json import dumps, loads
+from os import environ
 from pathlib import Path
-from typing import ClassVar, assert_never
+from types import MappingProxyType
+from typing import (
+    Any,
+    ClassVar,
+    assert_never,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+    override,
+)
 
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr, field_validator
 from pydantic_settings import BaseSettings
 from utilities.core import substitute
 from utilities.importlib import files
@@ -20,33 +36,75 @@ from qrt_pre_commit_hooks._constants import (
     GITEA_READ_TOKEN,
     GITEA_READ_WRITE_TOKEN,
     NANODE_PYPI_PASSWORD,
+    SETTINGS_TOML,
 )
 from qrt_pre_commit_hooks._enums import Index, Package
+from qrt_pre_commit_hooks._storage import (
+    get_cache_dir,
+    get_file_hash,
+    write_private_text,
+)
+from qrt_pre_commit_hooks._version import __version__
 
 _FILES = files(anchor="qrt_pre_commit_hooks")
-_SETTINGS_TOML = "settings.toml"
+_MAX_SNAPSHOTS = 16
 
 
 class _Settings(CustomBaseSettings):
     toml_files: ClassVar[Sequence[PathLikeOrWithSection]] = [
-        (_SETTINGS_TOML, "qrt_pre_commit_hooks"),
-        _FILES.joinpath(_SETTINGS_TOML),
+        (SETTINGS_TOML, "qrt_pre_commit_hooks"),
+        _FILES.joinpath(SETTINGS_TOML.name),
     ]
 
+    ci: _CISettings
     configs: _ConfigsSettings
     gitea: _GiteaSettings
     indexes: _IndexesSettings
-    packages: list[_Package1Settings]
+    packages: list[_PackageSettings]
+
+    @field_validator("packages")
+    @classmethod
+    def _check_packages(
+        cls, packages: list[_PackageSettings], /
+    ) -> list[_PackageSettings]:
+        _ = PackageRegistry.from_packages(packages)
+        return packages
+
+    @cached_property
+    def registry(self) -> PackageRegistry:
+        return PackageRegistry.from_packages(self.packages)
+
+
+class _CISettings(BaseSettings):
+    prek_cache_key_files: list[str]
+    prek_cache_key_prefix: str
+    uv_cache_key_files: list[str]
+    uv_cache_key_prefix: str
 
 
 class _ConfigsSettings(BaseSettings):
     dockerfile_tmpl: str
+    dockerfile_base_tmpl: str
+    dockerfile_runtime_tmpl: str
+    dockerfile_runtime_shared_tmpl: str
     root_pem_tmpl: str
 
     @property
     def dockerfile(self) -> Path:
         return Path(substitute(self.dockerfile_tmpl, files=_FILES))
 
+    @property
+    def dockerfile_base(self) -> Path:
+        return Path(substitute(self.dockerfile_base_tmpl, files=_FILES))
+
+    @property
+    def dockerfile_runtime(self) -> Path:
+        return Path(substitute(self.dockerfile_runtime_tmpl, files=_FILES))
+
+    @property
+    def dockerfile_runtime_shared(self) -> Path:
+        return Path(substitute(self.dockerfile_runtime_shared_tmpl, files=_FILES))
+
     @property
     def root_pem(self) -> Path:
         return Path(substitute(self.root_pem_tmpl, files=_FILES))
@@ -58,6 +116,11 @@ class _GiteaSettings(BaseSettings):
     owner: str
     username: str
     passwords: _GiteaPasswordsSettings
+    base_image: str
+
+    @property
+    def base_image_url(self) -> str:
+        return f"{self.host}:{self.port}/{self.owner}/{self.base_image}"
 
 
 class _GiteaPasswordsSettings(BaseSettings):
@@ -68,6 +131,7 @@ class _GiteaPasswordsSettings(BaseSettings):
 class _IndexesSettings(BaseSettings):
     gitea: _IndexesGiteaSettings
     nanode: _IndexesNanodeSettings
+    strategy: str
 
     def url(self, index: Index, /) -> str:
         match index:
@@ -78,6 +142,9 @@ class _IndexesSettings(BaseSettings):
             case never:
                 assert_never(never)
 
+    def read_url(self, index: Index, /) -> str:
+        return f"{self.url(index).rstrip('/')}/simple"
+
     def username(self, index: Index, /) -> str:
         match index:
             case Index.gitea:
@@ -126,12 +193,173 @@ class _IndexesNanodeSettings(BaseSettings):
     password: SecretStr
 
 
-class _Package1Settings(BaseSettings):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _PackageSettings:
     name: str
     type: Package
 
 
-SETTINGS = load_settings(_Settings)
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PackageRegistry:
+    types: Mapping[str, Package]
+    names: Mapping[Package, tuple[str, ...]]
+
+    @classmethod
+    def from_packages(cls, packages: Iterable[_PackageSettings], /) -> PackageRegistry:
+        types: dict[str, Package] = {}
+        for package in packages:
+            if package.name in types:
+                raise DuplicatePackageError(name=package.name)
+            types[package.name] = package.type
+        names = {
+            p: tuple(sorted(n for n, t in types.items() if t is p)) for p in Package
+        }
+        return cls(types=MappingProxyType(types), names=MappingProxyType(names))
+
+    def get(self, name: str, /) -> Package | None:
+        return self.types.get(name)
+
+
+@dataclass(kw_only=True, slots=True)
+class DuplicatePackageError(ValueError):
+    name: str
+
+    @override
+    def __str__(self) -> str:
+        return f"Package {self.name!r} is defined more than once"
+
+
+def get_settings() -> _Settings:
+    return _get_settings(get_settings_key())
+
+
+def get_settings_key() -> str:
+    hasher = sha256(__version__.encode())
+    for file in _Settings.toml_files:
+        path = file[0] if isinstance(file, tuple) else file
+        hasher.update(get_file_hash(path).encode())
+    for key, value in sorted(environ.items()):
+        if key.lower().startswith(tuple(_Settings.model_fields)):
+            hasher.update(f"{key}={value}".encode())
+    return hasher.hexdigest()
+
+
+@cache
+def _get_settings(key: str, /) -> _Settings:
+    _ = key  # a repo's settings.toml or environment may differ between calls
+    return _load_settings()
+
+
+def _load_settings() -> _Settings:
+    key = get_settings_key()
+    path = get_cache_dir() / "settings" / f"{key}.json"
+    try:
+        return _construct(_Settings, loads(path.read_text()), key=key)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    settings = _load_sources(key)
+    try:
+        write_private_text(path, dumps(settings.model_dump(), default=_redact))
+        _prune_snapshots(path.parent)
+    except OSError:
+        pass
+    return settings
+
+
+@cache
+def _load_sources(key: str, /) -> _Settings:
+    _ = key
+    return load_settings(_Settings)
+
+
+def _construct(
+    type_: Any, value: Any, /, *, key: str, path: tuple[str | int, ...] = ()
+) -> Any:
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        _ = type_.model_rebuild()  # resolve forward references in a fresh process
+        return type_.model_construct(**{
+            k: _construct(f.annotation, value[k], key=key, path=(*path, k))
+            for k, f in type_.model_fields.items()
+        })
+    if isinstance(type_, type) and is_dataclass(type_):
+        hints = get_type_hints(type_)
+        return type_(**{
+            f.name: _construct(
+                hints[f.name], value[f.name], key=key, path=(*path, f.name)
+            )
+            for f in fields(type_)
+        })
+    if get_origin(type_) is list:
+        (inner,) = get_args(type_)
+        return [
+            _construct(inner, v, key=key, path=(*path, i)) for i, v in enumerate(value)
+        ]
+    if type_ is SecretStr:
+        return _DeferredSecretStr(key=key, path=path)
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        return type_(value)
+    return value
+
+
+def _prune_snapshots(path: Path, /) -> None:
+    snapshots = sorted(
+        path.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, reverse=True
+    )
+    for stale in snapshots[_MAX_SNAPSHOTS:]:
+        stale.unlink(missing_ok=True)
+
+
+def _redact(obj: Any, /) -> Any:
+    if isinstance(obj, SecretStr):
+        return None
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+class _DeferredSecretStr(SecretStr):
+    def __init__(self, *, key: str, path: tuple[str | int, ...]) -> None:
+        super().__init__("")
+        self._key = key
+        self._path = path
+
+    @override
+    def get_secret_value(self) -> str:
+        value: Any = _load_sources(self._key)
+        for part in self._path:
+            value = value[part] if isinstance(part, int) else getattr(value, part)
+        return cast("SecretStr", value).get_secret_value()
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SecretStr) and (
+            self.get_secret_value() == other.get_secret_value()
+        )
+
+    @override
+    def __hash__(self) -> int:
+        return hash(self.get_secret_value())
+
+    @override
+    def __len__(self) -> int:
+        return len(self.get_secret_value())
+
+    @override
+    def _display(self) -> str:
+        return "**********"
+
+
+class _LazySettings:
+    def __getattr__(self, name: str, /) -> Any:
+        return getattr(get_settings(), name)
+
+
+SETTINGS = cast("_Settings", _LazySettings())
 
 
-__all__ = ["SETTINGS"]
+__all__ = [
+    "SETTINGS",
+    "DuplicatePackageError",
+    "PackageRegistry",
+    "get_settings",
+    "get_settings_key",
+]
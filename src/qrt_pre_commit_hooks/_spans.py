@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from json import dumps, loads
+from math import ceil
+from os import environ, getpid
+from pathlib import Path
+from time import perf_counter, time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from utilities.types import PathLike
+
+
+TRACE_ENV_VAR = "QRT_PRE_COMMIT_HOOKS_TRACE"
+SPANS_JSONL = Path(".logs/spans.jsonl")
+_HOOK: ContextVar[str | None] = ContextVar("_HOOK", default=None)
+_ROOT: ContextVar[Path | None] = ContextVar("_ROOT", default=None)
+
+
+@dataclass(kw_only=True, slots=True)
+class Span:
+    hook: str | None
+    phase: str
+    context: str | None = None
+    path: str | None = None
+    time: float
+    pid: int
+    duration: float = 0.0
+    bytes_read: int | None = None
+    bytes_written: int | None = None
+    written: bool | None = None
+    cached: bool | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SpanSummary:
+    hook: str | None
+    phase: str
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+def get_spans_path() -> Path:
+    root = _ROOT.get()
+    return SPANS_JSONL if root is None else root / SPANS_JSONL
+
+
+def is_tracing() -> bool:
+    return environ.get(TRACE_ENV_VAR, "") not in {"", "0"}
+
+
+@contextmanager
+def yield_span(
+    phase: str,
+    /,
+    *,
+    hook: str | None = None,
+    context: str | None = None,
+    path: PathLike | None = None,
+) -> Iterator[Span | None]:
+    if not is_tracing():
+        yield None
+        return
+    hook_use = _HOOK.get() if hook is None else hook
+    token = _HOOK.set(hook_use)
+    span = Span(
+        hook=hook_use,
+        phase=phase,
+        context=context,
+        path=None if path is None else str(path),
+        time=time(),
+        pid=getpid(),
+    )
+    start = perf_counter()
+    try:
+        yield span
+    finally:
+        span.duration = perf_counter() - start
+        _HOOK.reset(token)
+        _write_span(span)
+
+
+@contextmanager
+def yield_spans_root(root: PathLike, /) -> Iterator[None]:
+    token = _ROOT.set(Path(root))
+    try:
+        yield
+    finally:
+        _ROOT.reset(token)
+
+
+def read_spans(path: PathLike = SPANS_JSONL, /) -> list[Span]:
+    with Path(path).open() as fh:
+        return [Span(**loads(line)) for line in fh if line.strip() != ""]
+
+
+def summarize_spans(spans: Iterable[Span], /) -> list[SpanSummary]:
+    groups: defaultdict[tuple[str | None, str], list[float]] = defaultdict(list)
+    for span in spans:
+        groups[span.hook, span.phase].append(span.duration)
+        groups[None, span.phase].append(span.duration)
+    summaries: list[SpanSummary] = []
+    for (hook, phase), durations in sorted(
+        groups.items(), key=lambda x: (x[0][0] is None, x[0][0] or "", x[0][1])
+    ):
+        durations.sort()
+        summaries.append(
+            SpanSummary(
+                hook=hook,
+                phase=phase,
+                count=len(durations),
+                p50=_percentile(durations, 50),
+                p90=_percentile(durations, 90),
+                p99=_percentile(durations, 99),
+                max=durations[-1],
+            )
+        )
+    return summaries
+
+
+def _percentile(durations: list[float], percent: int, /) -> float:
+    index = max(ceil(percent / 100 * len(durations)) - 1, 0)
+    return durations[index]
+
+
+def _write_span(span: Span, /) -> None:
+    path = get_spans_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open(mode="a") as fh:
+            _ = fh.write(dumps(asdict(span)) + "\n")
+    except OSError:
+        pass
+
+
+__all__ = [
+    "SPANS_JSONL",
+    "TRACE_ENV_VAR",
+    "Span",
+    "SpanSummary",
+    "get_spans_path",
+    "is_tracing",
+    "read_spans",
+    "summarize_spans",
+    "yield_span",
+    "yield_spans_root",
+]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from os import environ
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from utilities.types import PathLike
+
+
+def get_cache_dir() -> Path:
+    root = environ.get("XDG_CACHE_HOME", "")
+    root_use = Path(root) if root != "" else Path.home() / ".cache"
+    return root_use / "qrt-pre-commit-hooks"
+
+
+def get_file_hash(path: PathLike, /) -> str:
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return ""
+    return sha256(data).hexdigest()
+
+
+def write_private_text(path: PathLike, text: str, /) -> None:
+    path = Path(path)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with NamedTemporaryFile(  # created with mode 0o600
+        mode="w", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as temp:
+        _ = temp.write(text)
+    _ = Path(temp.name).replace(path)
+
+
+__all__ = ["get_cache_dir", "get_file_hash", "write_private_text"]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pathlib import Path
+from tomllib import loads
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from utilities.types import PathLike
+
+
+def get_project(path: PathLike, /) -> dict[str, Any]:
+    doc = read_toml(path)
+    project = None if doc is None else doc.get("project")
+    return project if isinstance(project, dict) else {}
+
+
+def read_toml(path: PathLike, /) -> dict[str, Any] | None:
+    try:
+        return loads(Path(path).read_text())
+    except FileNotFoundError:
+        return None
+
+
+__all__ = ["get_project", "read_toml"]
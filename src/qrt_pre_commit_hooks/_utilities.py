@@ -1,21 +1,48 @@
 from __future__ import annotations
 
+import sys
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from pre_commit_hooks.constants import DYCW_PRE_COMMIT_HOOKS_URL, PRE_COMMIT_CONFIG_YAML
 from pre_commit_hooks.utilities import (
     get_set_list_dicts,
     get_set_list_strs,
     get_set_partial_dict,
-    yield_yaml_dict,
 )
+from pre_commit_hooks.utilities import yield_text_file as _yield_text_file
+from pre_commit_hooks.utilities import yield_tool_uv as _yield_tool_uv
+from pre_commit_hooks.utilities import yield_yaml_dict as _yield_yaml_dict
+from utilities.constants import MONTH
+from utilities.core import is_debug, set_up_logging
+from utilities.traceback import make_except_hook
+
+from qrt_pre_commit_hooks._spans import is_tracing, yield_span
+from qrt_pre_commit_hooks._version import __version__
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, MutableSet
-    from pathlib import Path
+    from contextlib import AbstractContextManager
+
+    from utilities.types import PathLike, StrDict
+
+
+def get_add_hooks_args(dict_: StrDict, /) -> list[str]:
+    repos = get_set_list_dicts(dict_, "repos")
+    repo = get_set_partial_dict(repos, {"repo": DYCW_PRE_COMMIT_HOOKS_URL})
+    hooks = get_set_list_dicts(repo, "hooks")
+    hook = get_set_partial_dict(hooks, {"id": "add-hooks"})
+    return get_set_list_strs(hook, "args")
+
 
-    from utilities.types import PathLike
+@cache
+def set_up_cli() -> None:
+    set_up_logging("qrt_pre_commit_hooks", files=".logs", log_version=__version__)
+    sys.excepthook = make_except_hook(
+        path_max_age=MONTH, path=".logs/errors", version=__version__, pudb=is_debug
+    )
 
 
 @contextmanager
@@ -23,13 +50,96 @@ def yield_add_hooks_args(
     *,
     path: PathLike = PRE_COMMIT_CONFIG_YAML,
     modifications: MutableSet[Path] | None = None,
+    dict_: StrDict | None = None,
 ) -> Iterator[list[str]]:
-    with yield_yaml_dict(path, modifications=modifications) as dict_:
-        repos = get_set_list_dicts(dict_, "repos")
-        repo = get_set_partial_dict(repos, {"repo": DYCW_PRE_COMMIT_HOOKS_URL})
-        hooks = get_set_list_dicts(repo, "hooks")
-        hook = get_set_partial_dict(hooks, {"id": "add-hooks"})
-        yield get_set_list_strs(hook, "args")
+    if dict_ is not None:
+        yield get_add_hooks_args(dict_)
+        return
+    with _yield_traced(
+        _yield_yaml_dict(path, modifications=modifications),
+        context="yield_add_hooks_args",
+        path=path,
+    ) as dict_use:
+        yield get_add_hooks_args(dict_use)
+
+
+@contextmanager
+def yield_text_file(
+    path: PathLike, /, *, modifications: MutableSet[Path] | None = None
+) -> Iterator[Any]:
+    with _yield_traced(
+        _yield_text_file(path, modifications=modifications),
+        context="yield_text_file",
+        path=path,
+    ) as context:
+        yield context
+
+
+@contextmanager
+def yield_tool_uv(
+    path: PathLike, /, *, modifications: MutableSet[Path] | None = None
+) -> Iterator[Any]:
+    with _yield_traced(
+        _yield_tool_uv(path, modifications=modifications),
+        context="yield_tool_uv",
+        path=path,
+    ) as uv:
+        yield uv
+
+
+@contextmanager
+def yield_yaml_dict(
+    path: PathLike, /, *, modifications: MutableSet[Path] | None = None
+) -> Iterator[StrDict]:
+    with _yield_traced(
+        _yield_yaml_dict(path, modifications=modifications),
+        context="yield_yaml_dict",
+        path=path,
+    ) as dict_:
+        yield dict_
+
+
+@contextmanager
+def _yield_traced[T](
+    manager: AbstractContextManager[T], /, *, context: str, path: PathLike
+) -> Iterator[T]:
+    if not is_tracing():
+        with manager as value:
+            yield value
+        return
+    before = _get_stat(path)
+    with yield_span("parse", context=context, path=path) as span:
+        value = manager.__enter__()
+        if span is not None:
+            span.bytes_read = 0 if before is None else before[1]
+    try:
+        with yield_span("mutate", context=context, path=path):
+            yield value
+    except BaseException:
+        if not manager.__exit__(*sys.exc_info()):
+            raise
+        return
+    with yield_span("write", context=context, path=path) as span:
+        _ = manager.__exit__(None, None, None)
+        if span is not None:
+            after = _get_stat(path)
+            span.written = after != before
+            span.bytes_written = after[1] if span.written and after is not None else 0
+
+
+def _get_stat(path: PathLike, /) -> tuple[int, int] | None:
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
-__all__ = ["yield_add_hooks_args"]
+__all__ = [
+    "get_add_hooks_args",
+    "set_up_cli",
+    "yield_add_hooks_args",
+    "yield_text_file",
+    "yield_tool_uv",
+    "yield_yaml_dict",
+]
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+__version__ = "0.5.25"
+
+
+__all__ = ["__version__"]
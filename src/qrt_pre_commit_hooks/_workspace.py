@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import sys
+from contextlib import chdir, contextmanager
+from dataclasses import dataclass, field
+from difflib import unified_diff
+from hashlib import sha256
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import (
+    ENVRC,
+    GITEA_PUSH_YAML,
+    PRE_COMMIT_CONFIG_YAML,
+    PYPROJECT_TOML,
+)
+
+from qrt_pre_commit_hooks._constants import (
+    DOCKERFILE,
+    DOCKERIGNORE,
+    GITEA_PULL_REQUEST_YAML,
+    ROOT_PEM,
+    SETTINGS_TOML,
+)
+from qrt_pre_commit_hooks._executor import run_funcs
+from qrt_pre_commit_hooks._spans import yield_spans_root
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from utilities.types import PathLike
+
+
+TARGETS: tuple[Path, ...] = tuple(
+    map(
+        Path,
+        [
+            PRE_COMMIT_CONFIG_YAML,
+            PYPROJECT_TOML,
+            ENVRC,
+            GITEA_PUSH_YAML,
+            GITEA_PULL_REQUEST_YAML,
+            DOCKERFILE,
+            DOCKERIGNORE,
+            ROOT_PEM,
+            SETTINGS_TOML,  # read by the hooks, never written
+        ],
+    )
+)
+
+
+@dataclass(kw_only=True, slots=True)
+class Workspace:
+    root: Path
+    stage: Path
+    originals: dict[Path, bytes] = field(default_factory=dict)
+
+    def get_changes(self) -> dict[Path, bytes]:
+        changes: dict[Path, bytes] = {}
+        for path in sorted(self.stage.rglob("*")):
+            if path.is_file():
+                rel = path.relative_to(self.stage)
+                data = path.read_bytes()
+                if self.originals.get(rel) != data:
+                    changes[rel] = data
+        return changes
+
+    def get_diff(self) -> str:
+        lines: list[str] = []
+        for rel, data in self.get_changes().items():
+            before = self.originals.get(rel, b"").decode(errors="replace")
+            after = data.decode(errors="replace")
+            lines.extend(
+                unified_diff(
+                    before.splitlines(keepends=True),
+                    after.splitlines(keepends=True),
+                    fromfile=f"a/{rel}",
+                    tofile=f"b/{rel}",
+                )
+            )
+        return "".join(lines)
+
+    def get_digest(self) -> str:
+        hash_ = sha256()
+        for path in sorted(self.stage.rglob("*")):
+            if path.is_file():
+                hash_.update(str(path.relative_to(self.stage)).encode())
+                hash_.update(sha256(path.read_bytes()).digest())
+        return hash_.hexdigest()
+
+    def get_stage_path(self, path: PathLike, /) -> Path:
+        path = Path(path)
+        if path.is_absolute() and path.is_relative_to(self.root):
+            return self.stage / path.relative_to(self.root)
+        return path
+
+    def flush(self) -> list[Path]:
+        changes = self.get_changes()
+        for rel, data in changes.items():
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _ = path.write_bytes(data)
+        return list(changes)
+
+
+def run_check(
+    get_funcs: Callable[..., Iterable[Callable[[], bool]]],
+    /,
+    *,
+    paths: Iterable[PathLike] = (),
+    jobs: int = 1,
+) -> None:
+    paths_use = list(paths)
+    with (
+        yield_workspace(paths=paths_use, write=False) as workspace,
+        chdir(workspace.stage),
+    ):
+        try:
+            paths_stage = tuple(map(workspace.get_stage_path, paths_use))
+            run_funcs(get_funcs(paths=paths_stage), jobs=jobs)
+        finally:
+            _ = sys.stdout.write(workspace.get_diff())
+
+
+@contextmanager
+def yield_workspace(
+    root: PathLike | None = None,
+    /,
+    *,
+    write: bool = True,
+    paths: Iterable[PathLike] = (),
+) -> Iterator[Workspace]:
+    root_use = (Path.cwd() if root is None else Path(root)).resolve()
+    with TemporaryDirectory() as temp, yield_spans_root(root_use):
+        stage = Path(temp)
+        workspace = Workspace(root=root_use, stage=stage)
+        for rel in _get_staged(root_use, paths=paths):
+            try:
+                data = (root_use / rel).read_bytes()
+            except (FileNotFoundError, IsADirectoryError):
+                continue
+            path = stage / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _ = path.write_bytes(data)
+            workspace.originals[rel] = data
+        yield workspace
+        if write:
+            _ = workspace.flush()
+
+
+def _get_staged(root: Path, /, *, paths: Iterable[PathLike] = ()) -> list[Path]:
+    staged: dict[Path, None] = dict.fromkeys(TARGETS)
+    for path in map(Path, paths):
+        path_use = (root / path).resolve()
+        if not path_use.is_relative_to(root):
+            continue
+        rel = path_use.relative_to(root)
+        staged[rel] = None
+        for parent in rel.parents:
+            staged.update(dict.fromkeys(parent / t for t in TARGETS))
+    return list(staged)
+
+
+__all__ = ["TARGETS", "Workspace", "run_check", "yield_workspace"]
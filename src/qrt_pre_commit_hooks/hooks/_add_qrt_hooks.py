@@ -2,29 +2,29 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from click import command
 from pre_commit_hooks.click import paths_argument
 from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML, PYPROJECT_TOML
 from pre_commit_hooks.hooks.add_hooks import _add_hook
-from pre_commit_hooks.utilities import (
-    get_table,
-    merge_paths,
-    run_all,
-    run_all_maybe_raise,
-)
-from tomlkit.api import loads
-from utilities.click import CONTEXT_SETTINGS, to_args
-from utilities.core import OneEmptyError, is_pytest, one
+from pre_commit_hooks.utilities import merge_paths, run_all
+from utilities.click import CONTEXT_SETTINGS, flag, to_args
+from utilities.core import is_pytest, one
 from utilities.types import PathLike
 
+from qrt_pre_commit_hooks._cache import cached_run
+from qrt_pre_commit_hooks._click import check_option, jobs_option
 from qrt_pre_commit_hooks._constants import QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL
-from qrt_pre_commit_hooks._settings import SETTINGS
+from qrt_pre_commit_hooks._dispatch import converge_hooks
+from qrt_pre_commit_hooks._executor import run_funcs
+from qrt_pre_commit_hooks._project import get_project_info
+from qrt_pre_commit_hooks._utilities import set_up_cli
+from qrt_pre_commit_hooks._workspace import run_check
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from pathlib import Path
 
     from utilities.types import PathLike
 
@@ -33,16 +33,37 @@ if TYPE_CHECKING:
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
-def cli(*, paths: tuple[Path, ...]) -> None:
+@flag("--converge", default=False)
+@check_option
+@jobs_option
+def cli(*, paths: tuple[Path, ...], converge: bool, check: bool, jobs: int) -> None:
     if is_pytest():
         return
-    funcs: list[Callable[[], bool]] = [partial(_run, path=p) for p in paths]
-    run_all_maybe_raise(*funcs)
+    set_up_cli()
+    if check:
+        run_check(partial(_get_funcs, converge=converge), paths=paths, jobs=jobs)
+    else:
+        run_funcs(_get_funcs(paths=paths, converge=converge), jobs=jobs)
+
+
+def _get_funcs(
+    *, paths: tuple[Path, ...], converge: bool = False
+) -> list[Callable[[], bool]]:
+    if converge:
+        return [partial(_run_converge, path=p) for p in paths]
+    return [
+        cached_run(
+            "add-qrt-hooks",
+            partial(_run, path=p),
+            paths=[p, one(merge_paths(p, target=PYPROJECT_TOML))],
+        )
+        for p in paths
+    ]
 
 
 def _run(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
-    docker = _need_docker(path=path)
-    package = _get_package(path=path)
+    info = get_project_info(one(merge_paths(path, target=PYPROJECT_TOML)).parent)
+    docker, package = info.need_docker, info.package
     funcs: list[Callable[[], bool]] = [
         partial(_add_modify_direnv, path=path, package=package),
         partial(_add_modify_pre_commit, path=path, ci_image=docker, package=package),
@@ -55,6 +76,10 @@ def _run(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
     return run_all(*funcs)
 
 
+def _run_converge(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
+    return len(converge_hooks(Path(path).parent)) == 1
+
+
 def _add_modify_ci_push(
     index: Index, /, *, path: PathLike = PRE_COMMIT_CONFIG_YAML
 ) -> bool:
@@ -136,35 +161,3 @@ def _add_setup_docker(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
         type_="editor",
     )
     return len(modifications) == 0
-
-
-def _get_package(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> Package | None:
-    path_use = one(merge_paths(path, target=PYPROJECT_TOML))
-    try:
-        doc = loads(path_use.read_text())
-    except FileNotFoundError:
-        return None
-    try:
-        project = get_table(doc, "project")
-        name = project["name"]
-    except KeyError:
-        return None
-    try:
-        return one(p.type for p in SETTINGS.packages if p.name == name)
-    except OneEmptyError:
-        return None
-
-
-def _need_docker(*, path: PathLike = PRE_COMMIT_CONFIG_YAML) -> bool:
-    path_use = one(merge_paths(path, target=PYPROJECT_TOML))
-    try:
-        doc = loads(path_use.read_text())
-    except FileNotFoundError:
-        return False
-    try:
-        project = get_table(doc, "project")
-        scripts = get_table(project, "scripts")
-        name = project["name"]
-    except KeyError:
-        return False
-    return f"{name}-cli" in scripts
@@ -1,38 +1,76 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import TYPE_CHECKING
+from pathlib import Path
+from re import search
+from typing import TYPE_CHECKING, Any
 
 from click import command
 from pre_commit_hooks.click import paths_argument
-from pre_commit_hooks.constants import GITEA_PUSH_YAML
+from pre_commit_hooks.constants import (
+    GITEA_PUSH_YAML,
+    PRE_COMMIT_CONFIG_YAML,
+    PYTHON_VERSION,
+)
 from pre_commit_hooks.hooks.setup_ci_push import _add_publish_package
-from pre_commit_hooks.utilities import merge_paths, run_all_maybe_raise
+from pre_commit_hooks.utilities import merge_paths
 from utilities.click import CONTEXT_SETTINGS
 from utilities.core import is_pytest
 from utilities.types import PathLike
 
-from qrt_pre_commit_hooks._click import index_req_option
-from qrt_pre_commit_hooks._constants import ACTION_TOKEN
+from qrt_pre_commit_hooks._cache import cached_run
+from qrt_pre_commit_hooks._click import check_option, index_req_option, jobs_option
+from qrt_pre_commit_hooks._constants import ACTION_TOKEN, GITEA_PULL_REQUEST_YAML
 from qrt_pre_commit_hooks._enums import Index
+from qrt_pre_commit_hooks._executor import run_funcs
+from qrt_pre_commit_hooks._project import get_project_info
 from qrt_pre_commit_hooks._settings import SETTINGS
+from qrt_pre_commit_hooks._utilities import set_up_cli, yield_yaml_dict
+from qrt_pre_commit_hooks._workspace import run_check
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from pathlib import Path
+    from collections.abc import Callable, MutableSet
 
-    from utilities.types import PathLike
+    from utilities.types import PathLike, StrDict
+
+
+_PREK_CACHE_STEP_NAME = "Cache the prek environments"
+_UV_ACTIONS = (  # actions which run uv themselves
+    "astral-sh/setup-uv",
+    "dycw/action-publish-package",
+    "dycw/action-pyright",
+    "dycw/action-pytest",
+)
+_UV_CACHE_STEP_NAME = "Cache uv"
+_UV_PRUNE_STEP_NAME = "Prune the uv cache"
 
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
 @index_req_option
-def cli(*, paths: tuple[Path, ...], index: Index) -> None:
+@check_option
+@jobs_option
+def cli(*, paths: tuple[Path, ...], index: Index, check: bool, jobs: int) -> None:
     if is_pytest():
         return
+    set_up_cli()
+    if check:
+        run_check(partial(_get_funcs, index=index), paths=paths, jobs=jobs)
+    else:
+        run_funcs(_get_funcs(paths=paths, index=index), jobs=jobs)
+
+
+def _get_funcs(*, paths: tuple[Path, ...], index: Index) -> list[Callable[[], bool]]:
     paths_use = merge_paths(*paths, target=GITEA_PUSH_YAML)
-    funcs: list[Callable[[], bool]] = [partial(_run, index, path=p) for p in paths_use]
-    run_all_maybe_raise(*funcs)
+    return [
+        cached_run(
+            "modify-ci-push",
+            partial(_run, index, path=p),
+            args=[index],
+            paths=[p, *_get_cache_paths(p)],
+        )
+        for p in paths_use
+    ]
 
 
 def _run(index: Index, /, *, path: PathLike = GITEA_PUSH_YAML) -> bool:
@@ -48,4 +86,108 @@ def _run(index: Index, /, *, path: PathLike = GITEA_PUSH_YAML) -> bool:
             password=SETTINGS.indexes.password(Index.gitea, write=True, ci=True),
             publish_url=SETTINGS.indexes.url(Index.gitea),
         )
+    for path_i in [Path(path), Path(path).with_name(GITEA_PULL_REQUEST_YAML.name)]:
+        if path_i.is_file():
+            _add_caches(path=path_i, modifications=modifications)
     return len(modifications) == 0
+
+
+def _add_caches(
+    *, path: PathLike = GITEA_PUSH_YAML, modifications: MutableSet[Path] | None = None
+) -> None:
+    version = get_project_info(_get_root(path)).python_version
+    with yield_yaml_dict(path, modifications=modifications) as dict_:
+        jobs = dict_.get("jobs")
+        for job in jobs.values() if isinstance(jobs, dict) else []:
+            steps = job.get("steps") if isinstance(job, dict) else None
+            if isinstance(steps, list) and (_runs_uv(steps) or _runs_prek(steps)):
+                job["steps"] = _get_steps_with_caches(
+                    steps, version=version or PYTHON_VERSION
+                )
+
+
+def _get_cache_paths(path: PathLike, /) -> list[Path]:
+    return [
+        Path(path).with_name(GITEA_PULL_REQUEST_YAML.name),
+        _get_root(path) / PRE_COMMIT_CONFIG_YAML,
+    ]
+
+
+def _get_cache_step(
+    name: str, path: str, prefix: str, files: list[str], /, *, version: str = ""
+) -> StrDict:
+    parts = [prefix, "${{ runner.os }}", *([version] if version else [])]
+    restore_key = "-".join(parts)
+    hash_files = ", ".join(f"'{f}'" for f in files)
+    return {
+        "name": name,
+        "uses": "actions/cache@v4",
+        "with": {
+            "path": path,
+            "key": f"{restore_key}-${{{{ hashFiles({hash_files}) }}}}",
+            "restore-keys": f"{restore_key}-",
+        },
+    }
+
+
+def _get_root(path: PathLike, /) -> Path:
+    return Path(path).parent.parent.parent
+
+
+def _get_steps_with_caches(steps: list[Any], /, *, version: str) -> list[Any]:
+    managed = {_PREK_CACHE_STEP_NAME, _UV_CACHE_STEP_NAME, _UV_PRUNE_STEP_NAME}
+    steps_use = [
+        s for s in steps if not (isinstance(s, dict) and (s.get("name") in managed))
+    ]
+    uv, prek = _runs_uv(steps_use), _runs_prek(steps_use)
+    checkouts = [
+        i
+        for i, s in enumerate(steps_use)
+        if isinstance(s, dict) and str(s.get("uses", "")).startswith("actions/checkout")
+    ]
+    index = checkouts[0] + 1 if len(checkouts) >= 1 else 0
+    ci = SETTINGS.ci
+    caches: list[StrDict] = []
+    if uv:
+        caches.append(
+            _get_cache_step(
+                _UV_CACHE_STEP_NAME,
+                "~/.cache/uv",
+                ci.uv_cache_key_prefix,
+                ci.uv_cache_key_files,
+            )
+        )
+    if prek:
+        caches.append(
+            _get_cache_step(
+                _PREK_CACHE_STEP_NAME,
+                "~/.cache/prek",
+                ci.prek_cache_key_prefix,
+                ci.prek_cache_key_files,
+                version=version,
+            )
+        )
+    steps_use[index:index] = caches
+    if uv:
+        steps_use.append({
+            "name": _UV_PRUNE_STEP_NAME,
+            "run": "uv cache prune --ci || true",
+        })
+    return steps_use
+
+
+def _runs_prek(steps: list[Any], /) -> bool:
+    return any(
+        "prek" in f"{s.get('run', '')} {s.get('uses', '')}"
+        for s in steps
+        if isinstance(s, dict)
+    )
+
+
+def _runs_uv(steps: list[Any], /) -> bool:
+    return any(
+        (search(r"\buvx?\b", str(s.get("run", ""))) is not None)
+        or str(s.get("uses", "")).startswith(_UV_ACTIONS)
+        for s in steps
+        if isinstance(s, dict)
+    )
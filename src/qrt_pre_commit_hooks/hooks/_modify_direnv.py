@@ -2,65 +2,164 @@ from __future__ import annotations
 
 from functools import partial
 from pathlib import Path
-from re import MULTILINE, escape, search
+from re import MULTILINE, sub
+from shlex import quote
 from typing import TYPE_CHECKING
 
 from click import command
 from pre_commit_hooks.click import paths_argument
 from pre_commit_hooks.constants import ENVRC
-from pre_commit_hooks.utilities import merge_paths, run_all_maybe_raise, yield_text_file
-from utilities.click import CONTEXT_SETTINGS
+from pre_commit_hooks.utilities import merge_paths
+from utilities.click import CONTEXT_SETTINGS, option
 from utilities.core import is_pytest, normalize_multi_line_str
-from utilities.types import PathLike
 
-from qrt_pre_commit_hooks._click import package_option
+from qrt_pre_commit_hooks._blocks import set_blocks
+from qrt_pre_commit_hooks._cache import cached_run
+from qrt_pre_commit_hooks._click import (
+    check_option,
+    discover_option,
+    jobs_option,
+    package_option,
+)
+from qrt_pre_commit_hooks._discover import (
+    discover_paths,
+    get_member_package,
+    merge_member_paths,
+)
+from qrt_pre_commit_hooks._executor import run_funcs
+from qrt_pre_commit_hooks._utilities import set_up_cli, yield_text_file
+from qrt_pre_commit_hooks._workspace import run_check
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, MutableSet
-    from pathlib import Path
+    from collections.abc import Callable, Sequence
 
     from utilities.types import PathLike
 
     from qrt_pre_commit_hooks._enums import Package
 
 
+_LEGACY_SOPS = (
+    r'^# sops\nif \[ -f "[^"\n]*" \]; then\n\texport SOPS_AGE_KEY_FILE="[^"\n]*"\nfi\n?'
+)
+_SOPS_CACHE_BODY = normalize_multi_line_str("""
+    _qrt_sops_hash() {
+    \tif has sha256sum; then sha256sum; else shasum -a 256; fi | cut -d' ' -f1
+    }
+    _qrt_sops_mtime() {
+    \tstat -c %Y "$1" 2>/dev/null || stat -f %m "$1" 2>/dev/null || true
+    }
+    _qrt_sops_load() {
+    \tlocal key="${SOPS_AGE_KEY_FILE:-}" hash name
+    \twatch_file "$1"
+    \tif [ -n "${key}" ]; then watch_file "${key}"; fi
+    \thash=$({ _qrt_sops_hash <"$1"; _qrt_sops_mtime "${key}"; } | _qrt_sops_hash)
+    \tname=$(printf '%s' "${PWD}/$1" | _qrt_sops_hash)
+    \tlocal dir="${XDG_CACHE_HOME:-${HOME}/.cache}/qrt-direnv"
+    \tlocal cache="${dir}/${name}-${hash}.env"
+    \tif [ ! -f "${cache}" ]; then
+    \t\t(
+    \t\t\tumask 077 && mkdir -p "${dir}" &&
+    \t\t\t\tsops -d --output-type dotenv "$1" >"${cache}.tmp" &&
+    \t\t\t\trm -f "${dir}/${name}-"*.env && mv "${cache}.tmp" "${cache}"
+    \t\t) || { rm -f "${cache}.tmp"; return 1; }
+    \tfi
+    \tdotenv "${cache}"
+    }
+""")
+
+
 @command(**CONTEXT_SETTINGS)
 @paths_argument
 @package_option
-def cli(*, paths: tuple[Path, ...], package: Package | None) -> None:
+@option(
+    "--sops-file",
+    "sops_files",
+    type=str,
+    multiple=True,
+    help="An encrypted dotenv file to decrypt via a cache",
+)
+@discover_option
+@check_option
+@jobs_option
+def cli(
+    *,
+    paths: tuple[Path, ...],
+    package: Package | None,
+    sops_files: tuple[str, ...],
+    discover: bool,
+    check: bool,
+    jobs: int,
+) -> None:
     if is_pytest():
         return
-    paths_use = merge_paths(*paths, target=ENVRC)
-    funcs: list[Callable[[], bool]] = [
-        partial(_run, path=p, package=package) for p in paths_use
+    set_up_cli()
+    if check:
+        paths_use = (*paths, *discover_paths(ENVRC)) if discover else paths
+        run_check(
+            partial(
+                _get_funcs, package=package, sops_files=sops_files, discover=discover
+            ),
+            paths=paths_use,
+            jobs=jobs,
+        )
+    else:
+        funcs = _get_funcs(
+            paths=paths, package=package, sops_files=sops_files, discover=discover
+        )
+        run_funcs(funcs, jobs=jobs)
+
+
+def _get_funcs(
+    *,
+    paths: tuple[Path, ...],
+    package: Package | None = None,
+    sops_files: tuple[str, ...] = (),
+    discover: bool = False,
+) -> list[Callable[[], bool]]:
+    if discover:
+        paths_use = merge_member_paths(*paths, target=ENVRC)
+        packages = [get_member_package(p.parent) or package for p in paths_use]
+    else:
+        paths_use = merge_paths(*paths, target=ENVRC)
+        packages = [package] * len(paths_use)
+    return [
+        cached_run(
+            "modify-direnv",
+            partial(_run, path=p, package=package_i, sops_files=sops_files),
+            args=[package_i, sops_files],
+            paths=[p],
+        )
+        for p, package_i in zip(paths_use, packages, strict=True)
     ]
-    run_all_maybe_raise(*funcs)
 
 
-def _run(*, path: PathLike = ENVRC, package: Package | None = None) -> bool:
+def _run(
+    *,
+    path: PathLike = ENVRC,
+    package: Package | None = None,
+    sops_files: Sequence[str] = (),
+) -> bool:
     modifications: set[Path] = set()
-    if package is not None:
-        _add_sops(package, path=path, modifications=modifications)
+    if (package is None) and (len(sops_files) == 0) and not Path(path).exists():
+        return True
+    with yield_text_file(path, modifications=modifications) as context:
+        output = context.output
+        if package is not None:
+            output = sub(_LEGACY_SOPS, "", output, flags=MULTILINE)
+        sops = None if package is None else _get_sops_text(package)
+        cache = _get_sops_cache_text(sops_files) if len(sops_files) >= 1 else None
+        context.output = set_blocks(output, {"sops": sops, "sops-cache": cache})
     return len(modifications) == 0
 
 
-def _add_sops(
-    package: Package,
-    /,
-    *,
-    path: PathLike = ENVRC,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
-    with yield_text_file(path, modifications=modifications) as context:
-        text = _get_sops_text(package)
-        if search(escape(text), context.output, flags=MULTILINE) is None:
-            context.output += f"\n\n{text}"
+def _get_sops_cache_text(files: Sequence[str], /) -> str:
+    calls = "".join(f"_qrt_sops_load {quote(f)}\n" for f in files)
+    return f"{_SOPS_CACHE_BODY}{calls}"
 
 
 def _get_sops_text(package: Package, /) -> str:
     path = f"${{HOME}}/secrets/age/{package.value}.txt"
     return normalize_multi_line_str(f"""
-        # sops
         if [ -f "{path}" ]; then
         \texport SOPS_AGE_KEY_FILE="{path}"
         fi
@@ -11,29 +11,34 @@ from pre_commit_hooks.utilities import (
     ensure_contains,
     get_set_list_dicts,
     get_set_partial_dict,
-    run_all_maybe_raise,
-    yield_yaml_dict,
 )
 from utilities.click import CONTEXT_SETTINGS, flag
 from utilities.core import is_pytest
 from utilities.pydantic import extract_secret
 from utilities.types import PathLike
 
-from qrt_pre_commit_hooks._click import package_option
+from qrt_pre_commit_hooks._cache import cached_run
+from qrt_pre_commit_hooks._click import check_option, jobs_option, package_option
 from qrt_pre_commit_hooks._constants import (
     ACTION_TOKEN,
     GITEA_READ_WRITE_TOKEN,
     QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL,
     SOPS_AGE_KEY,
 )
+from qrt_pre_commit_hooks._executor import run_funcs
 from qrt_pre_commit_hooks._settings import SETTINGS
-from qrt_pre_commit_hooks._utilities import yield_add_hooks_args
+from qrt_pre_commit_hooks._utilities import (
+    set_up_cli,
+    yield_add_hooks_args,
+    yield_yaml_dict,
+)
+from qrt_pre_commit_hooks._workspace import run_check
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, MutableSet
+    from collections.abc import Callable
     from pathlib import Path
 
-    from utilities.types import PathLike
+    from utilities.types import PathLike, StrDict
 
     from qrt_pre_commit_hooks._enums import Index, Package
 
@@ -42,13 +47,43 @@ if TYPE_CHECKING:
 @paths_argument
 @flag("--ci-image", default=False)
 @package_option
-def cli(*, paths: tuple[Path, ...], ci_image: bool, package: Package | None) -> None:
+@check_option
+@jobs_option
+def cli(
+    *,
+    paths: tuple[Path, ...],
+    ci_image: bool,
+    package: Package | None,
+    check: bool,
+    jobs: int,
+) -> None:
     if is_pytest():
         return
-    funcs: list[Callable[[], bool]] = [
-        partial(_run, path=p, ci_image=ci_image, package=package) for p in paths
+    set_up_cli()
+    if check:
+        run_check(
+            partial(_get_funcs, ci_image=ci_image, package=package),
+            paths=paths,
+            jobs=jobs,
+        )
+    else:
+        run_funcs(
+            _get_funcs(paths=paths, ci_image=ci_image, package=package), jobs=jobs
+        )
+
+
+def _get_funcs(
+    *, paths: tuple[Path, ...], ci_image: bool = False, package: Package | None = None
+) -> list[Callable[[], bool]]:
+    return [
+        cached_run(
+            "modify-pre-commit",
+            partial(_run, path=p, ci_image=ci_image, package=package),
+            args=[ci_image, package],
+            paths=[p],
+        )
+        for p in paths
     ]
-    run_all_maybe_raise(*funcs)
 
 
 def _run(
@@ -58,22 +93,19 @@ def _run(
     package: Package | None = None,
 ) -> bool:
     modifications: set[Path] = set()
-    _add_ci_token_github(path=path, modifications=modifications)
-    _add_pytest_sops_age_key(path=path, modifications=modifications)
-    _add_priority(path=path, modifications=modifications)
-    if ci_image:
-        _add_ci_image(path=path, modifications=modifications)
-    if package is not None:
-        _add_index(package.pkg_index, path=path, modifications=modifications)
+    with yield_yaml_dict(path, modifications=modifications) as dict_:
+        _add_ci_token_github(dict_)
+        _add_pytest_sops_age_key(dict_)
+        _add_priority(dict_)
+        if ci_image:
+            _add_ci_image(dict_)
+        if package is not None:
+            _add_index(dict_, package.pkg_index)
     return len(modifications) == 0
 
 
-def _add_ci_image(
-    *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
-    with yield_add_hooks_args(path=path, modifications=modifications) as args:
+def _add_ci_image(dict_: StrDict, /) -> None:
+    with yield_add_hooks_args(dict_=dict_) as args:
         ensure_contains(
             args,
             "--ci-image",
@@ -86,23 +118,13 @@ def _add_ci_image(
         )
 
 
-def _add_ci_token_github(
-    *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
-    with yield_add_hooks_args(path=path, modifications=modifications) as args:
+def _add_ci_token_github(dict_: StrDict, /) -> None:
+    with yield_add_hooks_args(dict_=dict_) as args:
         ensure_contains(args, f"--ci-token-github={ACTION_TOKEN}")
 
 
-def _add_index(
-    index: Index,
-    /,
-    *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
-    with yield_add_hooks_args(path=path, modifications=modifications) as args:
+def _add_index(dict_: StrDict, index: Index, /) -> None:
+    with yield_add_hooks_args(dict_=dict_) as args:
         settings = SETTINGS.indexes
         ensure_contains(
             args,
@@ -115,25 +137,16 @@ def _add_index(
         )
 
 
-def _add_priority(
-    *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
-    with yield_yaml_dict(path, modifications=modifications) as dict_:
-        repos = get_set_list_dicts(dict_, "repos")
-        repo = get_set_partial_dict(
-            repos, {"repo": QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL}
-        )
-        hooks = get_set_list_dicts(repo, "hooks")
-        hook = get_set_partial_dict(hooks, {"id": "add-qrt-hooks"})
-        hook["priority"] = PRE_COMMIT_PRIORITY
+def _add_priority(dict_: StrDict, /) -> None:
+    repos = get_set_list_dicts(dict_, "repos")
+    repo = get_set_partial_dict(
+        repos, {"repo": QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL}
+    )
+    hooks = get_set_list_dicts(repo, "hooks")
+    hook = get_set_partial_dict(hooks, {"id": "add-qrt-hooks"})
+    hook["priority"] = PRE_COMMIT_PRIORITY
 
 
-def _add_pytest_sops_age_key(
-    *,
-    path: PathLike = PRE_COMMIT_CONFIG_YAML,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
-    with yield_add_hooks_args(path=path, modifications=modifications) as args:
+def _add_pytest_sops_age_key(dict_: StrDict, /) -> None:
+    with yield_add_hooks_args(dict_=dict_) as args:
         ensure_contains(args, f"--ci-pytest-sops-age-key={SOPS_AGE_KEY}")
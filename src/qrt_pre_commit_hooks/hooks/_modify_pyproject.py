@@ -1,30 +1,40 @@
 from __future__ import annotations
 
 from functools import partial
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from click import command
 from pre_commit_hooks.click import paths_argument
 from pre_commit_hooks.constants import PYPROJECT_TOML
-from pre_commit_hooks.utilities import (
-    get_set_table,
-    merge_paths,
-    run_all_maybe_raise,
-    yield_tool_uv,
-)
-from tomlkit import inline_table
+from pre_commit_hooks.utilities import get_set_table, merge_paths
+from tomlkit import aot, inline_table, table
+from tomlkit.items import AoT
 from utilities.click import CONTEXT_SETTINGS
 from utilities.core import is_pytest
-from utilities.types import PathLike
 
-from qrt_pre_commit_hooks._click import package_req_option
+from qrt_pre_commit_hooks._cache import cached_run
+from qrt_pre_commit_hooks._click import (
+    check_option,
+    discover_option,
+    jobs_option,
+    package_req_option,
+)
+from qrt_pre_commit_hooks._discover import (
+    discover_paths,
+    get_member_package,
+    merge_member_paths,
+)
+from qrt_pre_commit_hooks._enums import Index
+from qrt_pre_commit_hooks._executor import run_funcs
 from qrt_pre_commit_hooks._settings import SETTINGS
+from qrt_pre_commit_hooks._utilities import set_up_cli, yield_tool_uv
+from qrt_pre_commit_hooks._workspace import run_check
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, MutableSet
+    from collections.abc import Callable
     from pathlib import Path
 
+    from tomlkit.items import Table
     from utilities.types import PathLike
 
     from qrt_pre_commit_hooks._settings import Package
@@ -33,34 +43,84 @@ if TYPE_CHECKING:
 @command(**CONTEXT_SETTINGS)
 @paths_argument
 @package_req_option
-def cli(*, paths: tuple[Path, ...], package: Package) -> None:
+@discover_option
+@check_option
+@jobs_option
+def cli(
+    *, paths: tuple[Path, ...], package: Package, discover: bool, check: bool, jobs: int
+) -> None:
     if is_pytest():
         return
-    paths_use = merge_paths(*paths, target=PYPROJECT_TOML)
-    funcs: list[Callable[[], bool]] = [
-        partial(_run, package, path=p) for p in paths_use
+    set_up_cli()
+    if check:
+        paths_use = (*paths, *discover_paths(PYPROJECT_TOML)) if discover else paths
+        run_check(
+            partial(_get_funcs, package=package, discover=discover),
+            paths=paths_use,
+            jobs=jobs,
+        )
+    else:
+        run_funcs(
+            _get_funcs(paths=paths, package=package, discover=discover), jobs=jobs
+        )
+
+
+def _get_funcs(
+    *, paths: tuple[Path, ...], package: Package, discover: bool = False
+) -> list[Callable[[], bool]]:
+    if discover:
+        paths_use = merge_member_paths(*paths, target=PYPROJECT_TOML)
+        packages = [get_member_package(p.parent) or package for p in paths_use]
+    else:
+        paths_use = merge_paths(*paths, target=PYPROJECT_TOML)
+        packages = [package] * len(paths_use)
+    return [
+        cached_run(
+            "modify-pyproject",
+            partial(_run, package_i, path=p),
+            args=[package_i],
+            paths=[p],
+        )
+        for p, package_i in zip(paths_use, packages, strict=True)
     ]
-    run_all_maybe_raise(*funcs)
 
 
 def _run(package: Package, /, *, path: PathLike = PYPROJECT_TOML) -> bool:
     modifications: set[Path] = set()
-    _add_sources(package, path=path, modifications=modifications)
+    with yield_tool_uv(path, modifications=modifications) as uv:
+        uv["index-strategy"] = SETTINGS.indexes.strategy
+        _add_sources(package, uv)
+        _add_index(package, uv)
     return len(modifications) == 0
 
 
-def _add_sources(
-    package: Package,
-    /,
-    *,
-    path: PathLike = PYPROJECT_TOML,
-    modifications: MutableSet[Path] | None = None,
-) -> None:
+def _add_index(package: Package, uv: Table, /) -> None:
+    index = package.pkg_index
+    url = SETTINGS.indexes.read_url(index)
+    entries = uv.get("index")
+    if not isinstance(entries, AoT):
+        entries = uv["index"] = aot()
+    names = {i.value for i in Index}
+    current = next((e for e in entries if e.get("name") == index.value), None)
+    for entry in [
+        e for e in entries if (e.get("name") in names) and (e is not current)
+    ]:
+        entries.remove(entry)
+    if current is None:
+        current = table()
+        current.trivia.indent = "\n"  # blank line before `[[tool.uv.index]]`
+        current["name"] = index.value
+        entries.append(current)
+    if current.get("url") != url:
+        current["url"] = url
+    if current.get("explicit") is not True:
+        current["explicit"] = True
+
+
+def _add_sources(package: Package, uv: Table, /) -> None:
     inner = inline_table()
     inner["index"] = package.pkg_index.value
-    with yield_tool_uv(path, modifications=modifications) as uv:
-        sources = get_set_table(uv, "sources")
-        sources.clear()
-        for package_i in sorted(SETTINGS.packages, key=lambda x: x.name):
-            if package_i.type is package:
-                sources[package_i.name] = inner
+    sources = get_set_table(uv, "sources")
+    sources.clear()
+    for name in SETTINGS.registry.names[package]:
+        sources[name] = inner
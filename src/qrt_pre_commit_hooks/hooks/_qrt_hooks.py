@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from os import environ
+from pathlib import Path
+
+from click import Choice, UsageError, echo, group
+from click import Path as ClickPath
+from pre_commit_hooks.constants import PYTHON_VERSION
+from utilities.click import CONTEXT_SETTINGS, flag, option
+from utilities.core import is_pytest
+
+from qrt_pre_commit_hooks._bundle import BUNDLE_DIR, build_bundle
+from qrt_pre_commit_hooks._click import check_option
+from qrt_pre_commit_hooks._dispatch import HOOKS, check_hooks, run_hooks
+from qrt_pre_commit_hooks._fleet import FleetStatus, get_fleet_repos, run_fleet
+from qrt_pre_commit_hooks._project import get_project_info
+from qrt_pre_commit_hooks._server import IDLE_TIMEOUT, serve
+from qrt_pre_commit_hooks._spans import (
+    SPANS_JSONL,
+    TRACE_ENV_VAR,
+    read_spans,
+    summarize_spans,
+)
+from qrt_pre_commit_hooks._utilities import set_up_cli
+from qrt_pre_commit_hooks.hooks._setup_docker import write_base_dockerfile
+
+
+@group(**CONTEXT_SETTINGS)
+@flag("--trace", default=False)
+def cli(*, trace: bool) -> None:
+    if trace:
+        environ[TRACE_ENV_VAR] = "1"
+
+
+@cli.command(name="run", **CONTEXT_SETTINGS)
+@option(
+    "--root",
+    type=ClickPath(exists=True, file_okay=False, path_type=Path),
+    default=Path.cwd,
+    help="The repo root",
+)
+@option(
+    "--hook",
+    "hooks",
+    type=Choice(HOOKS),
+    multiple=True,
+    help="The hooks to run; defaults to those configured in the repo",
+)
+@check_option
+def run_cli(*, root: Path, hooks: tuple[str, ...], check: bool) -> None:
+    if is_pytest():
+        return
+    set_up_cli()
+    hooks_use = hooks if len(hooks) >= 1 else None
+    if check:
+        result = check_hooks(root, hooks=hooks_use)
+        echo(result.diff, nl=False)
+        results = result.results
+    else:
+        results = run_hooks(root, hooks=hooks_use)
+    for hook, result in results.items():
+        echo(f"{hook}: {'Passed' if result else 'Failed'}")
+    if not all(results.values()):
+        raise SystemExit(1)
+
+
+@cli.command(name="base-image", **CONTEXT_SETTINGS)
+@option(
+    "--python-version",
+    type=str,
+    default=None,
+    help="The Python version; defaults to that of the repo's pre-commit config",
+)
+@option(
+    "--output",
+    type=ClickPath(file_okay=False, path_type=Path),
+    default=Path("docker/base"),
+    help="The directory to render the base image build context into",
+)
+def base_image_cli(*, python_version: str | None, output: Path) -> None:
+    if is_pytest():
+        return
+    set_up_cli()
+    version = python_version or get_project_info().python_version or PYTHON_VERSION
+    echo(write_base_dockerfile(output, version=version))
+
+
+@cli.command(name="bundle", **CONTEXT_SETTINGS)
+@option(
+    "--output",
+    type=ClickPath(file_okay=False, path_type=Path),
+    default=BUNDLE_DIR,
+    help="The directory to write the bundle to",
+)
+def bundle_cli(*, output: Path) -> None:
+    if is_pytest():
+        return
+    set_up_cli()
+    echo(build_bundle(output))
+
+
+@cli.command(name="fleet", **CONTEXT_SETTINGS)
+@option(
+    "--dir",
+    "dir_",
+    type=ClickPath(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="A directory of checkouts",
+)
+@option(
+    "--base",
+    type=ClickPath(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="The base path of the checkouts of the registered packages",
+)
+@option("--jobs", type=int, default=None, help="The number of worker processes")
+@flag("--dry-run", default=False)
+def fleet_cli(
+    *, dir_: Path | None, base: Path | None, jobs: int | None, dry_run: bool
+) -> None:
+    if is_pytest():
+        return
+    set_up_cli()
+    if (dir_ is None) and (base is None):
+        msg = "One of '--dir' or '--base' is required"
+        raise UsageError(msg)
+    repos = get_fleet_repos(dir_=dir_, base=base)
+    results = run_fleet(repos, jobs=jobs, dry_run=dry_run)
+    for result in results:
+        line = f"{result.repo}: {result.status.value}"
+        if result.status is FleetStatus.modified:
+            line += f" ({', '.join(h for h, r in result.hooks.items() if not r)})"
+        if result.traceback is not None:
+            line += f" ({result.traceback})"
+        echo(line)
+    if any(r.status is FleetStatus.error for r in results):
+        raise SystemExit(1)
+
+
+@cli.command(name="serve", **CONTEXT_SETTINGS)
+@option(
+    "--socket",
+    "socket_",
+    type=ClickPath(dir_okay=False, path_type=Path),
+    default=None,
+    help="The socket path; defaults to one in the repo's .git directory",
+)
+@option(
+    "--idle-timeout",
+    type=float,
+    default=IDLE_TIMEOUT,
+    help="Seconds without a request before the server exits",
+)
+def serve_cli(*, socket_: Path | None, idle_timeout: float) -> None:
+    if is_pytest():
+        return
+    serve(path=socket_, idle_timeout=idle_timeout)
+
+
+@cli.command(name="spans", **CONTEXT_SETTINGS)
+@option(
+    "--path",
+    type=ClickPath(exists=True, dir_okay=False, path_type=Path),
+    default=SPANS_JSONL,
+    help="The span records",
+)
+def spans_cli(*, path: Path) -> None:
+    if is_pytest():
+        return
+    headers = " ".join(f"{h:>9}" for h in ["p50", "p90", "p99", "max"])
+    echo(f"{'hook':<20} {'phase':<8} {'count':>6} {headers}")
+    for summary in summarize_spans(read_spans(path)):
+        times = [summary.p50, summary.p90, summary.p99, summary.max]
+        cells = " ".join(f"{1e3 * t:>7.2f}ms" for t in times)
+        echo(
+            f"{summary.hook or '(all)':<20} {summary.phase:<8} {summary.count:>6} {cells}"
+        )
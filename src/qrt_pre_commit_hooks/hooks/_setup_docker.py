@@ -2,19 +2,30 @@ from __future__ import annotations
 
 from functools import partial
 from pathlib import Path
-from re import search
+from re import MULTILINE, findall, sub
 from typing import TYPE_CHECKING
 
 from click import command
 from pre_commit_hooks.click import paths_argument
 from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML, PYTHON_VERSION
-from pre_commit_hooks.utilities import merge_paths, run_all_maybe_raise, yield_text_file
-from utilities.click import CONTEXT_SETTINGS
-from utilities.core import OneEmptyError, is_pytest, one, substitute
+from pre_commit_hooks.utilities import merge_paths
+from utilities.click import CONTEXT_SETTINGS, flag
+from utilities.core import is_pytest, substitute
 
-from qrt_pre_commit_hooks._constants import DOCKERFILE, ROOT_PEM
+from qrt_pre_commit_hooks._blocks import set_blocks
+from qrt_pre_commit_hooks._cache import cached_run
+from qrt_pre_commit_hooks._click import check_option, jobs_option
+from qrt_pre_commit_hooks._constants import (
+    DEBIAN_VERSION,
+    DOCKERFILE,
+    DOCKERIGNORE,
+    ROOT_PEM,
+)
+from qrt_pre_commit_hooks._executor import run_funcs
+from qrt_pre_commit_hooks._project import get_project_info
 from qrt_pre_commit_hooks._settings import SETTINGS
-from qrt_pre_commit_hooks._utilities import yield_add_hooks_args
+from qrt_pre_commit_hooks._utilities import set_up_cli, yield_text_file
+from qrt_pre_commit_hooks._workspace import run_check
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -24,37 +35,69 @@ if TYPE_CHECKING:
 
 @command(**CONTEXT_SETTINGS)
 @paths_argument
-def cli(*, paths: tuple[Path, ...]) -> None:
+@flag("--shared-base", default=False)
+@check_option
+@jobs_option
+def cli(*, paths: tuple[Path, ...], shared_base: bool, check: bool, jobs: int) -> None:
     if is_pytest():
         return
+    set_up_cli()
+    if check:
+        run_check(partial(_get_funcs, shared_base=shared_base), paths=paths, jobs=jobs)
+    else:
+        run_funcs(_get_funcs(paths=paths, shared_base=shared_base), jobs=jobs)
+
+
+def _get_funcs(
+    *, paths: tuple[Path, ...], shared_base: bool = False
+) -> list[Callable[[], bool]]:
     funcs: list[Callable[[], bool]] = []
     paths_use1 = merge_paths(*paths, target=DOCKERFILE, also_ok=ROOT_PEM)
-    funcs.extend([partial(_run_dockerfile, path=p) for p in paths_use1])
+    funcs.extend(
+        cached_run(
+            "setup-docker",
+            partial(_run_dockerfile, path=p, shared_base=shared_base),
+            args=[shared_base],
+            paths=[p, Path(p).parent.parent / PRE_COMMIT_CONFIG_YAML],
+        )
+        for p in paths_use1
+    )
+    paths_use3 = [Path(p).parent.parent / DOCKERIGNORE for p in paths_use1]
+    funcs.extend(
+        cached_run(
+            "setup-docker",
+            partial(_run_dockerignore, path=p, shared_base=shared_base),
+            args=[shared_base],
+            paths=[p],
+        )
+        for p in paths_use3
+    )
     paths_use2 = merge_paths(*paths, target=ROOT_PEM, also_ok=DOCKERFILE)
-    funcs.extend([partial(_run_root_pem, path=p) for p in paths_use2])
-    run_all_maybe_raise(*funcs)
+    funcs.extend(
+        cached_run("setup-docker", partial(_run_root_pem, path=p), paths=[p])
+        for p in paths_use2
+    )
+    return funcs
 
 
-def _run_dockerfile(*, path: PathLike = DOCKERFILE) -> bool:
+def _run_dockerfile(*, path: PathLike = DOCKERFILE, shared_base: bool = False) -> bool:
     modifications: set[Path] = set()
-    with yield_add_hooks_args(
-        path=Path(path).parent.parent / PRE_COMMIT_CONFIG_YAML
-    ) as args:
-        try:
-            version = one(
-                m.group(1)
-                for a in args
-                if (m := search(r"^--python-version=(\d+\.\d+)$", a)) is not None
-            )
-        except OneEmptyError:
-            version = PYTHON_VERSION
+    info = get_project_info(Path(path).parent.parent)
+    version = info.python_version or PYTHON_VERSION
     with yield_text_file(path, modifications=modifications) as context:
-        text = substitute(
-            SETTINGS.configs.dockerfile,
-            mapping={"DOCKERFILE_DEFAULT_PYTHON_VERSION": version},
-            safe=True,
+        context.output = _get_dockerfile_text(version, shared_base=shared_base)
+    return len(modifications) == 0
+
+
+def _run_dockerignore(
+    *, path: PathLike = DOCKERIGNORE, shared_base: bool = False
+) -> bool:
+    modifications: set[Path] = set()
+    text = _get_dockerfile_text(PYTHON_VERSION, shared_base=shared_base)
+    with yield_text_file(path, modifications=modifications) as context:
+        context.output = set_blocks(
+            context.output, {"dockerignore": _get_dockerignore_text(text)}, prepend=True
         )
-        context.output = text
     return len(modifications) == 0
 
 
@@ -63,3 +106,48 @@ def _run_root_pem(*, path: PathLike = ROOT_PEM) -> bool:
     with yield_text_file(path, modifications=modifications) as context:
         context.output = SETTINGS.configs.root_pem.read_text()
     return len(modifications) == 0
+
+
+def write_base_dockerfile(root: PathLike, /, *, version: str = PYTHON_VERSION) -> str:
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    _ = (root / "Dockerfile").write_text(_get_base_dockerfile_text(version))
+    _ = (root / ROOT_PEM.name).write_text(SETTINGS.configs.root_pem.read_text())
+    return _get_base_image_tag(version)
+
+
+def _get_base_dockerfile_text(version: str, /) -> str:
+    return substitute(
+        SETTINGS.configs.dockerfile_base, mapping=_get_mapping(version), safe=True
+    )
+
+
+def _get_base_image_tag(version: str, /) -> str:
+    return f"{SETTINGS.gitea.base_image_url}:{version}-{DEBIAN_VERSION}"
+
+
+def _get_dockerfile_text(version: str, /, *, shared_base: bool = False) -> str:
+    configs = SETTINGS.configs
+    runtime = (
+        configs.dockerfile_runtime_shared if shared_base else configs.dockerfile_runtime
+    )
+    mapping = _get_mapping(version) | {
+        "DOCKERFILE_RUNTIME": runtime.read_text().rstrip("\n")
+    }
+    return substitute(configs.dockerfile, mapping=mapping, safe=True)
+
+
+def _get_dockerignore_text(dockerfile: str, /) -> str:
+    copies = findall(r"^COPY (?!--)(\S+) ", dockerfile, flags=MULTILINE)
+    binds = findall(r"--mount=type=bind,source=([^,\s]+)", dockerfile)
+    sources = sorted({sub(r"\$\{\w+\}", "*", s) for s in [*copies, *binds]})
+    lines = ["*", *(f"!{s}" for s in sources), "**/__pycache__"]
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _get_mapping(version: str, /) -> dict[str, str]:
+    return {
+        "DOCKERFILE_BASE_IMAGE": SETTINGS.gitea.base_image_url,
+        "DOCKERFILE_DEFAULT_DEBIAN_VERSION": DEBIAN_VERSION,
+        "DOCKERFILE_DEFAULT_PYTHON_VERSION": version,
+    }
@@ -4,7 +4,9 @@ from typing import TYPE_CHECKING
 
 from pre_commit_hooks.constants import GITEA_PUSH_YAML
 from utilities.core import normalize_multi_line_str
+from yaml import safe_load
 
+from qrt_pre_commit_hooks._constants import GITEA_PULL_REQUEST_YAML
 from qrt_pre_commit_hooks._enums import Index
 from qrt_pre_commit_hooks.hooks._modify_ci_push import _run
 
@@ -20,6 +22,12 @@ class TestModifyCIPush:
               publish-package-gitea:
                 runs-on: ubuntu-latest
                 steps:
+                - name: Cache uv
+                  uses: actions/cache@v4
+                  with:
+                    path: ~/.cache/uv
+                    key: uv-${{ runner.os }}-${{ hashFiles('uv.lock') }}
+                    restore-keys: uv-${{ runner.os }}-
                 - name: Update CA certificates
                   run: sudo update-ca-certificates
                 - name: Build and publish the package
@@ -30,6 +38,8 @@ class TestModifyCIPush:
                     password: ${{secrets.QRT_GITEA_READ_WRITE_TOKEN}}
                     publish-url: https://gitea.qrt:3000/api/packages/qrt/pypi
                     native-tls: true
+                - name: Prune the uv cache
+                  run: uv cache prune --ci || true
         """)
         for i in range(2):
             result = _run(Index.nanode, path=path)
@@ -42,3 +52,60 @@ class TestModifyCIPush:
         path = tmp_path / GITEA_PUSH_YAML
         assert _run(Index.gitea, path=path)
         assert not path.exists()
+
+    def test_pull_request(self, *, tmp_path: Path) -> None:
+        path = tmp_path / GITEA_PUSH_YAML
+        pull_request = tmp_path / GITEA_PULL_REQUEST_YAML
+        pull_request.parent.mkdir(parents=True)
+        _ = pull_request.write_text(
+            normalize_multi_line_str("""
+                jobs:
+                  prek:
+                    runs-on: ubuntu-latest
+                    steps:
+                    - uses: actions/checkout@v4
+                    - run: prek run --all-files
+            """)
+        )
+        for i in range(2):
+            result = _run(Index.gitea, path=path)
+            assert result is (i >= 1)
+        names = [
+            s.get("name")
+            for s in safe_load(pull_request.read_text())["jobs"]["prek"]["steps"]
+        ]
+        assert names == [None, "Cache the prek environments", None]
+        assert "prek-${{ runner.os }}-3." in pull_request.read_text()
+
+    def test_jobs(self, *, tmp_path: Path) -> None:
+        path = tmp_path / GITEA_PUSH_YAML
+        path.parent.mkdir(parents=True)
+        _ = path.write_text(
+            normalize_multi_line_str("""
+            jobs:
+              tag:
+                runs-on: ubuntu-latest
+                steps:
+                - name: Tag the latest commit
+                  uses: dycw/action-tag-commit@latest
+              test:
+                runs-on: ubuntu-latest
+                steps:
+                - echo start
+                - run: uv run pytest
+        """)
+        )
+        for i in range(2):
+            result = _run(Index.gitea, path=path)
+            assert result is (i >= 1)
+        jobs = safe_load(path.read_text())["jobs"]
+        assert jobs["tag"]["steps"] == [
+            {"name": "Tag the latest commit", "uses": "dycw/action-tag-commit@latest"}
+        ]
+        steps = jobs["test"]["steps"]
+        assert [s if isinstance(s, str) else s.get("name") for s in steps] == [
+            "Cache uv",
+            "echo start",
+            None,
+            "Prune the uv cache",
+        ]
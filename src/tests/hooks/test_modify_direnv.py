@@ -1,22 +1,31 @@
 from __future__ import annotations
 
+from os import environ
+from subprocess import check_output
 from typing import TYPE_CHECKING
 
-from pre_commit_hooks.constants import ENVRC
-from utilities.core import check_multi_line_regex, normalize_multi_line_str
+from pre_commit_hooks.constants import ENVRC, PRE_COMMIT_CONFIG_YAML
+from utilities.core import check_multi_line_regex, normalize_multi_line_str, one
 
+from qrt_pre_commit_hooks._cache import NO_CACHE_ENV_VAR
 from qrt_pre_commit_hooks._enums import Package
-from qrt_pre_commit_hooks.hooks._modify_direnv import _get_sops_text, _run
+from qrt_pre_commit_hooks.hooks._modify_direnv import (
+    _SOPS_CACHE_BODY,
+    _get_funcs,
+    _get_sops_text,
+    _run,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest import MonkeyPatch
+
 
 class TestGetText:
     def test_sops(self) -> None:
         result = _get_sops_text(Package.trading)
         expected = normalize_multi_line_str("""
-            # sops
             if [ -f "${HOME}/secrets/age/trading.txt" ]; then
             \texport SOPS_AGE_KEY_FILE="${HOME}/secrets/age/trading.txt"
             fi
@@ -28,10 +37,11 @@ class TestModifyDirenv:
     def test_main(self, *, tmp_path: Path) -> None:
         path = tmp_path / ENVRC
         exp_output = normalize_multi_line_str(r"""
-            # sops
+            # >>> qrt:sops
             if \[ -f "\${HOME}/secrets/age/trading.txt" \]; then
             \texport SOPS_AGE_KEY_FILE="\${HOME}/secrets/age/trading.txt"
             fi
+            # <<< qrt:sops
         """)
         for i in range(2):
             result = _run(path=path, package=Package.trading)
@@ -39,3 +49,77 @@ class TestModifyDirenv:
             assert result is exp_result
             contents = path.read_text()
             check_multi_line_regex(exp_output, contents)
+
+    def test_sops_cache(self, *, tmp_path: Path) -> None:
+        path = tmp_path / ENVRC
+        for i in range(2):
+            result = _run(path=path, sops_files=["secrets.env"])
+            assert result is (i >= 1)
+        contents = path.read_text()
+        assert contents.count("# >>> qrt:sops-cache") == 1
+        assert "_qrt_sops_load secrets.env\n# <<< qrt:sops-cache" in contents
+        assert "umask 077" in contents
+        assert 'watch_file "$1"' in contents
+
+    def test_sops_cache_refresh(self, *, tmp_path: Path) -> None:
+        script = normalize_multi_line_str("""
+            has() { command -v "$1" >/dev/null; }
+            watch_file() { :; }
+            dotenv() { cat "$1"; }
+            sops() { cat "$4"; }
+        """)
+        for name in ["a", "a", "b"]:
+            _ = (tmp_path / "secrets.env").write_text(f"NAME={name}\n")
+            result = check_output(
+                ["bash", "-c", f"{script}{_SOPS_CACHE_BODY}_qrt_sops_load secrets.env"],
+                cwd=tmp_path,
+                env={"PATH": environ["PATH"], "XDG_CACHE_HOME": str(tmp_path)},
+                text=True,
+            )
+            assert result == f"NAME={name}\n"
+        cache = one((tmp_path / "qrt-direnv").iterdir())
+        assert cache.read_text() == "NAME=b\n"
+        assert cache.stat().st_mode & 0o777 == 0o600
+
+    def test_sops_cache_replaced(self, *, tmp_path: Path) -> None:
+        path = tmp_path / ENVRC
+        _ = path.write_text("export FOO=1\n")
+        _ = _run(path=path, sops_files=["a.env"])
+        assert not _run(path=path, sops_files=["a.env", "b c.env"])
+        contents = path.read_text()
+        assert contents.startswith("export FOO=1\n")
+        assert contents.count("# >>> qrt:sops-cache") == 1
+        assert "_qrt_sops_load a.env\n_qrt_sops_load 'b c.env'\n" in contents
+
+    def test_package_changed(self, *, tmp_path: Path) -> None:
+        path = tmp_path / ENVRC
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                export FOO=1
+
+                # sops
+                if [ -f "${HOME}/secrets/age/infra.txt" ]; then
+                \texport SOPS_AGE_KEY_FILE="${HOME}/secrets/age/infra.txt"
+                fi
+            """)
+        )
+        for _ in range(2):
+            _ = _run(path=path, package=Package.trading)
+        contents = path.read_text()
+        assert contents.startswith("export FOO=1\n")
+        assert "infra.txt" not in contents
+        assert contents.count("trading.txt") == 2
+        assert contents.count("# >>> qrt:sops") == 1
+
+    def test_discover_config(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        config = tmp_path / PRE_COMMIT_CONFIG_YAML
+        _ = config.write_text("repos: []\n")
+        funcs = _get_funcs(
+            paths=(PRE_COMMIT_CONFIG_YAML,), package=Package.trading, discover=True
+        )
+        for func in funcs:
+            _ = func()
+        assert config.read_text() == "repos: []\n"
+        assert "trading.txt" in (tmp_path / ENVRC).read_text()
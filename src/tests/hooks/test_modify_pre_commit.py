@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML
+from pre_commit_hooks.utilities import yield_yaml_dict
 
+from qrt_pre_commit_hooks._enums import Package
+from qrt_pre_commit_hooks.hooks import _modify_pre_commit
 from qrt_pre_commit_hooks.hooks._modify_pre_commit import _run
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
+    from pytest import MonkeyPatch
+    from utilities.types import StrDict
+
 
 class TestModifyPreCommit:
     def test_main(self, *, tmp_path: Path) -> None:
@@ -18,3 +26,19 @@ class TestModifyPreCommit:
             expected = i >= 1
             assert result is expected
             assert path.is_file()
+
+    def test_single_session(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        path = tmp_path / PRE_COMMIT_CONFIG_YAML
+        sessions: list[Path] = []
+
+        @contextmanager
+        def counting(path: Path, /, **kwargs: Any) -> Iterator[StrDict]:
+            sessions.append(path)
+            with yield_yaml_dict(path, **kwargs) as dict_:
+                yield dict_
+
+        monkeypatch.setattr(_modify_pre_commit, "yield_yaml_dict", counting)
+        for i in range(2):
+            result = _run(path=path, ci_image=True, package=Package.trading)
+            assert result is (i >= 1)
+            assert len(sessions) == i + 1
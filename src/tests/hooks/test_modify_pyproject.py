@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+from tomllib import loads
 from typing import TYPE_CHECKING
 
-from pre_commit_hooks.constants import PYPROJECT_TOML
+from pre_commit_hooks.constants import PRE_COMMIT_CONFIG_YAML, PYPROJECT_TOML
 from utilities.core import normalize_multi_line_str
 
-from qrt_pre_commit_hooks._enums import Package
-from qrt_pre_commit_hooks.hooks._modify_pyproject import _run
+from qrt_pre_commit_hooks._cache import NO_CACHE_ENV_VAR
+from qrt_pre_commit_hooks._enums import Index, Package
+from qrt_pre_commit_hooks._settings import SETTINGS
+from qrt_pre_commit_hooks.hooks._modify_pyproject import _get_funcs, _run
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest import MonkeyPatch
+
 
 class TestModifyPyProject:
     def test_main(self, *, tmp_path: Path) -> None:
         path = tmp_path / PYPROJECT_TOML
         exp_output = normalize_multi_line_str(r"""
+            [tool.uv]
+            index-strategy = "first-index"
+
             [tool.uv.sources]
             backfill = {index = "gitea"}
             backtest = {index = "gitea"}
@@ -33,6 +41,11 @@ class TestModifyPyProject:
             signals = {index = "gitea"}
             test-package = {index = "gitea"}
             testing = {index = "gitea"}
+
+            [[tool.uv.index]]
+            name = "gitea"
+            url = "https://gitea.qrt:3000/api/packages/qrt/pypi/simple"
+            explicit = true
         """)
         for i in range(2):
             result = _run(Package.trading, path=path)
@@ -40,3 +53,78 @@ class TestModifyPyProject:
             assert result is exp_result
             contents = path.read_text()
             assert contents == exp_output
+
+    def test_existing(self, *, tmp_path: Path) -> None:
+        path = tmp_path / PYPROJECT_TOML
+        text = normalize_multi_line_str("""
+            [tool.uv]
+            index-strategy = "first-index"
+
+            [[tool.uv.index]]
+            explicit = true
+            name = "nanode"
+            url = "https://pypi.queensberryresearch.com/simple"
+
+            [tool.uv.sources]
+            nanode = {index = "nanode"}
+        """)
+        _ = path.write_text(text)
+        _ = _run(Package.infra, path=path)
+        assert path.read_text().startswith(text[: text.index("[tool.uv.sources]")])
+
+    def test_stale(self, *, tmp_path: Path) -> None:
+        path = tmp_path / PYPROJECT_TOML
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                [tool.uv.sources]
+                stale = {index = "gitea"}
+
+                [[tool.uv.index]]
+                name = "gitea"
+                url = "https://example.com/stale"
+
+                [[tool.uv.index]]
+                name = "pytorch"
+                url = "https://download.pytorch.org/whl/cpu"
+            """)
+        )
+        assert not _run(Package.infra, path=path)
+        assert _run(Package.infra, path=path)
+        uv = loads(path.read_text())["tool"]["uv"]
+        assert "stale" not in uv["sources"]
+        assert [i["name"] for i in uv["index"]] == ["pytorch", "nanode"]
+        assert uv["index"][1]["url"] == SETTINGS.indexes.read_url(Index.nanode)
+
+    def test_discover(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        for rel, name in [("a", "backfill"), ("b", "gitea"), ("c", "unknown")]:
+            path = tmp_path / rel / PYPROJECT_TOML
+            path.parent.mkdir()
+            _ = path.write_text(f'[project]\nname = "{name}"\n')
+        funcs = _get_funcs(paths=(), package=Package.infra, discover=True)
+        assert len(funcs) == 3
+        for func in funcs:
+            _ = func()
+
+        def get_index(rel: str, /) -> str:
+            doc = loads((tmp_path / rel / PYPROJECT_TOML).read_text())
+            return doc["tool"]["uv"]["index"][0]["name"]
+
+        assert [get_index(r) for r in ["a", "b", "c"]] == ["gitea", "nanode", "nanode"]
+
+    def test_discover_config(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        config = tmp_path / PRE_COMMIT_CONFIG_YAML
+        _ = config.write_text("repos: []\n")
+        _ = (tmp_path / PYPROJECT_TOML).write_text('[project]\nname = "gitea"\n')
+        funcs = _get_funcs(
+            paths=(PRE_COMMIT_CONFIG_YAML,), package=Package.infra, discover=True
+        )
+        assert len(funcs) == 1
+        for func in funcs:
+            _ = func()
+        assert config.read_text() == "repos: []\n"
+        doc = loads((tmp_path / PYPROJECT_TOML).read_text())
+        assert doc["tool"]["uv"]["index"][0]["name"] == "nanode"
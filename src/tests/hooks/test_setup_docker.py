@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from re import MULTILINE, split
+from typing import TYPE_CHECKING
+
+from qrt_pre_commit_hooks._constants import (
+    DEBIAN_VERSION,
+    DOCKERFILE,
+    DOCKERIGNORE,
+    ROOT_PEM,
+)
+from qrt_pre_commit_hooks._settings import SETTINGS
+from qrt_pre_commit_hooks.hooks._setup_docker import (
+    _run_dockerfile,
+    _run_dockerignore,
+    write_base_dockerfile,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestSetupDocker:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / DOCKERFILE
+        path.parent.mkdir()
+        for i in range(2):
+            result = _run_dockerfile(path=path)
+            assert result is (i >= 1)
+
+    def test_stages(self, *, tmp_path: Path) -> None:
+        path = tmp_path / DOCKERFILE
+        path.parent.mkdir()
+        _ = _run_dockerfile(path=path)
+        _, builder, _, runtime = split(r"^FROM .*$", path.read_text(), flags=MULTILINE)
+        for stage in [builder, runtime]:
+            assert "--mount=type=cache,target=/var/cache/apt" in stage
+            assert "--mount=type=cache,target=/var/lib/apt" in stage
+            assert "rm -rf /var/lib/apt/lists" not in stage
+        assert "build-essential libpq-dev" in builder
+        assert "build-essential" not in runtime
+        assert "libpq-dev" not in runtime
+        assert "age libpq5" in runtime
+
+    def test_shared_base(self, *, tmp_path: Path) -> None:
+        path = tmp_path / DOCKERFILE
+        path.parent.mkdir()
+        _ = _run_dockerfile(path=path)
+        _, expected, _, _ = split(r"^FROM .*$", path.read_text(), flags=MULTILINE)
+        _ = _run_dockerfile(path=path, shared_base=True)
+        _, builder, runtime = split(r"^FROM .*$", path.read_text(), flags=MULTILINE)
+        assert builder == expected
+        assert "apt-get" not in runtime
+        assert "COPY --from=builder /app /app" in runtime
+        base_url = SETTINGS.gitea.base_image_url
+        assert f"ARG BASE_IMAGE='{base_url}'" in path.read_text()
+
+
+class TestSetupDockerIgnore:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / DOCKERIGNORE
+        for i in range(2):
+            result = _run_dockerignore(path=path)
+            assert result is (i >= 1)
+        lines = path.read_text().splitlines()
+        assert lines[:2] == ["# >>> qrt:dockerignore", "*"]
+        assert {
+            "!README.md",
+            "!docker/root.pem",
+            "!pyproject.toml",
+            "!src/*",
+            "!uv.lock",
+        } <= set(lines)
+        assert not any(line.startswith("!.git") for line in lines)
+
+    def test_extra(self, *, tmp_path: Path) -> None:
+        path = tmp_path / DOCKERIGNORE
+        _ = _run_dockerignore(path=path)
+        _ = path.write_text(path.read_text() + "\n!data/fixtures.csv\n")
+        assert _run_dockerignore(path=path)
+        assert path.read_text().endswith("!data/fixtures.csv\n")
+
+
+class TestWriteBaseDockerfile:
+    def test_main(self, *, tmp_path: Path) -> None:
+        tag = write_base_dockerfile(tmp_path, version="3.13")
+        assert tag == f"{SETTINGS.gitea.base_image_url}:3.13-{DEBIAN_VERSION}"
+        text = (tmp_path / "Dockerfile").read_text()
+        assert "ARG PYTHON_VERSION='3.13'" in text
+        assert "age libpq5" in text
+        assert (tmp_path / ROOT_PEM.name).is_file()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pytest import raises
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks._blocks import UnterminatedBlockError, get_blocks, set_blocks
+
+
+class TestGetBlocks:
+    def test_main(self) -> None:
+        text = normalize_multi_line_str("""
+            export FOO=1
+            # >>> qrt:a
+            one
+            # <<< qrt:a
+            # >>> qrt:b
+            two
+            # <<< qrt:b
+        """)
+        assert get_blocks(text) == {"a": "one\n", "b": "two\n"}
+
+    def test_unterminated(self) -> None:
+        with raises(UnterminatedBlockError, match="Managed block 'a' has no end"):
+            _ = get_blocks("# >>> qrt:a\none\n")
+
+
+class TestSetBlocks:
+    def test_append(self) -> None:
+        result = set_blocks("export FOO=1\n", {"a": "one"})
+        expected = normalize_multi_line_str("""
+            export FOO=1
+
+            # >>> qrt:a
+            one
+            # <<< qrt:a
+        """)
+        assert result == expected
+
+    def test_prepend(self) -> None:
+        result = set_blocks("extra\n", {"a": "one\n"}, prepend=True)
+        assert result == "# >>> qrt:a\none\n# <<< qrt:a\n\nextra\n"
+
+    def test_replace(self) -> None:
+        text = set_blocks("before\n", {"a": "one\n", "b": "two\n"})
+        text = f"{text}after\n"
+        result = set_blocks(text, {"a": "three\n"})
+        assert get_blocks(result) == {"a": "three\n", "b": "two\n"}
+        assert result.startswith("before\n")
+        assert result.endswith("after\n")
+
+    def test_idempotent(self) -> None:
+        blocks = {"a": "one\n", "b": "two\n"}
+        text = set_blocks("export FOO=1\n", blocks)
+        assert set_blocks(text, blocks) == text
+
+    def test_remove(self) -> None:
+        text = set_blocks("export FOO=1\n", {"a": "one\n"})
+        assert set_blocks(text, {"a": None}) == "export FOO=1\n"
+
+    def test_comment(self) -> None:
+        result = set_blocks("", {"a": "one\n"}, comment="//")
+        assert result == "// >>> qrt:a\none\n// <<< qrt:a\n"
+
+    def test_unterminated(self) -> None:
+        with raises(UnterminatedBlockError):
+            _ = set_blocks("# >>> qrt:a\none\n", {"a": "two\n"})
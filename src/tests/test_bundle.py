@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from qrt_pre_commit_hooks._bundle import _compile_all, _get_digest, get_bundle_tag
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestGetBundleTag:
+    def test_main(self) -> None:
+        tag = get_bundle_tag()
+        assert tag.startswith(f"cp{sys.version_info.major}{sys.version_info.minor}-")
+        assert "." not in tag
+
+
+class TestCompileAll:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / "module.py").write_text("X = 1\n")
+        digest = _get_digest(tmp_path)
+        _compile_all(tmp_path)
+        assert len(list((tmp_path / "__pycache__").glob("module.*.pyc"))) == 1
+        assert _get_digest(tmp_path) != digest
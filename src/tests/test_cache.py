@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pytest import fixture
+
+from qrt_pre_commit_hooks import _cache
+from qrt_pre_commit_hooks._cache import NO_CACHE_ENV_VAR, cached_run
+from qrt_pre_commit_hooks._storage import get_cache_dir
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+@fixture(autouse=True)
+def cache_dir(*, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv(NO_CACHE_ENV_VAR, raising=False)
+
+
+class _Counter:
+    def __init__(self, *, result: bool = True) -> None:
+        super().__init__()
+        self.calls = 0
+        self.result = result
+
+    def __call__(self) -> bool:
+        self.calls += 1
+        return self.result
+
+
+class TestCachedRun:
+    def test_hit(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file"
+        _ = path.write_text("text")
+        counter = _Counter()
+        func = cached_run("hook", counter, args=["arg"], paths=[path])
+        for _ in range(3):
+            assert func()
+        assert counter.calls == 1
+
+    def test_not_conformant(self, *, tmp_path: Path) -> None:
+        counter = _Counter(result=False)
+        func = cached_run("hook", counter, paths=[tmp_path / "file"])
+        for _ in range(3):
+            assert not func()
+        assert counter.calls == 3
+
+    def test_input_changed(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "file"
+        _ = path.write_text("text")
+        counter = _Counter()
+        func = cached_run("hook", counter, paths=[path])
+        assert func()
+        _ = path.write_text("changed")
+        assert func()
+        assert counter.calls == 2
+
+    def test_args_changed(self, *, tmp_path: Path) -> None:
+        counter = _Counter()
+        path = tmp_path / "file"
+        assert cached_run("hook", counter, args=["a"], paths=[path])()
+        assert cached_run("hook", counter, args=["b"], paths=[path])()
+        assert cached_run("other", counter, args=["b"], paths=[path])()
+        assert counter.calls == 3
+
+    def test_settings_changed(
+        self, *, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        counter = _Counter()
+        func = cached_run("hook", counter, paths=[tmp_path / "file"])
+        assert func()
+        monkeypatch.setattr(_cache, "get_settings_key", lambda: "changed")
+        assert func()
+        assert counter.calls == 2
+
+    def test_bypass(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        counter = _Counter()
+        func = cached_run("hook", counter, paths=[tmp_path / "file"])
+        for _ in range(3):
+            assert func()
+        assert counter.calls == 3
+        assert not (get_cache_dir() / "results").exists()
+
+    def test_eviction(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(_cache, "MAX_RESULTS", 2)
+        counter = _Counter()
+        funcs = [
+            cached_run("hook", counter, args=[i], paths=[tmp_path / "file"])
+            for i in range(3)
+        ]
+        for func in funcs:
+            assert func()
+        assert len(list((get_cache_dir() / "results").iterdir())) == 2
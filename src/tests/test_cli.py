@@ -29,6 +29,7 @@ class TestCLI:
                 "modify-pyproject",
                 [str(PYPROJECT_TOML), "--package", Package.trading.value],
             ),
+            param("qrt-hooks", ["run"]),
             param("setup-docker", [str(PYPROJECT_TOML)]),
         ],
     )
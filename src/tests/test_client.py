@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from os import getuid
+from socket import AF_UNIX, SOCK_STREAM, socket
+from typing import TYPE_CHECKING
+
+from pytest import raises
+
+from qrt_pre_commit_hooks._client import (
+    _ENV_SETTINGS_PREFIXES,
+    SOCKET_NAME,
+    get_request_env,
+    get_socket_path,
+    is_private_dir,
+    request,
+)
+from qrt_pre_commit_hooks._settings import _Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+class TestGetRequestEnv:
+    def test_main(self) -> None:
+        env = {
+            "AWS_SECRET_ACCESS_KEY": "secret",
+            "GITEA_HOST": "localhost",
+            "PATH": "/usr/bin",
+            "QRT_PRE_COMMIT_HOOKS_TRACE": "1",
+            "XDG_CACHE_HOME": "/cache",
+        }
+        result = get_request_env(env)
+        assert set(result) == set(env) - {"AWS_SECRET_ACCESS_KEY"}
+
+    def test_settings(self) -> None:
+        assert set(_Settings.model_fields) == set(_ENV_SETTINGS_PREFIXES)
+
+
+class TestGetSocketPath:
+    def test_git(self, *, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "sub").mkdir()
+        result = get_socket_path(tmp_path / "sub")
+        assert result == tmp_path.resolve() / ".git" / SOCKET_NAME
+
+    def test_runtime_dir(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+        result = get_socket_path(tmp_path)
+        assert result.parent == tmp_path / "run"
+        assert result.name.startswith("qrt-hooks-")
+
+    def test_temp_dir(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        result = get_socket_path(tmp_path)
+        assert result.parent == tmp_path / f"qrt-hooks-{getuid()}"
+
+
+class TestIsPrivateDir:
+    def test_main(self, *, tmp_path: Path) -> None:
+        tmp_path.chmod(0o700)
+        assert is_private_dir(tmp_path)
+
+    def test_writable(self, *, tmp_path: Path) -> None:
+        tmp_path.chmod(0o777)
+        assert not is_private_dir(tmp_path)
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        assert not is_private_dir(tmp_path / "missing")
+
+
+class TestRequest:
+    def test_no_server(self, *, tmp_path: Path) -> None:
+        assert request("modify-direnv", [], path=tmp_path / "missing.sock") is None
+
+    def test_not_socket(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "hooks.sock"
+        path.touch()
+        assert request("modify-direnv", [], path=path) is None
+
+    def test_shared_dir(self, *, tmp_path: Path) -> None:
+        tmp_path.chmod(0o777)
+        path = tmp_path / "hooks.sock"
+        with socket(AF_UNIX, SOCK_STREAM) as server:
+            server.bind(str(path))
+            server.listen()
+            server.setblocking(False)  # noqa: FBT003
+            assert request("modify-direnv", [], path=path) is None
+            with raises(BlockingIOError):
+                _ = server.accept()
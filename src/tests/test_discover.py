@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import ENVRC, PRE_COMMIT_CONFIG_YAML, PYPROJECT_TOML
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks._discover import (
+    discover_members,
+    discover_paths,
+    get_member_package,
+    merge_member_paths,
+)
+from qrt_pre_commit_hooks._enums import Package
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+def _write_member(root: Path, rel: str, /, *, name: str = "package") -> Path:
+    path = root / rel / PYPROJECT_TOML
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(f'[project]\nname = "{name}"\n')
+    return path.parent
+
+
+class TestDiscoverMembers:
+    def test_walk(self, *, tmp_path: Path) -> None:
+        for rel in ["pkgs/a", "pkgs/b", ".venv/x", "node_modules/y", "build/z"]:
+            _ = _write_member(tmp_path, rel)
+        _ = (tmp_path / ".gitignore").write_text("build/\n")
+        result = discover_members(tmp_path)
+        assert result == [tmp_path / "pkgs/a", tmp_path / "pkgs/b"]
+
+    def test_gitignore_negate(self, *, tmp_path: Path) -> None:
+        for rel in ["pkgs/b1", "pkgs/b2"]:
+            _ = _write_member(tmp_path, rel)
+        _ = (tmp_path / "pkgs" / ".gitignore").write_text("b*\n!b1\n")
+        assert discover_members(tmp_path) == [tmp_path / "pkgs/b1"]
+
+    def test_uv_workspace(self, *, tmp_path: Path) -> None:
+        for rel in ["pkgs/a", "pkgs/b", "pkgs/c", "other"]:
+            _ = _write_member(tmp_path, rel)
+        _ = (tmp_path / PYPROJECT_TOML).write_text(
+            normalize_multi_line_str("""
+                [tool.uv.workspace]
+                members = ["pkgs/*"]
+                exclude = ["pkgs/c"]
+            """)
+        )
+        result = discover_members(tmp_path)
+        assert result == [tmp_path, tmp_path / "pkgs/a", tmp_path / "pkgs/b"]
+
+
+class TestDiscoverPaths:
+    def test_main(self, *, tmp_path: Path) -> None:
+        for rel in ["a", "b"]:
+            _ = _write_member(tmp_path, rel)
+        _ = (tmp_path / "a" / ENVRC).write_text("")
+        assert discover_paths(ENVRC, root=tmp_path) == [tmp_path / "a" / ENVRC]
+
+
+class TestGetMemberPackage:
+    def test_main(self, *, tmp_path: Path) -> None:
+        member = _write_member(tmp_path, "a", name="backfill")
+        assert get_member_package(member) is Package.trading
+
+    def test_unknown(self, *, tmp_path: Path) -> None:
+        assert get_member_package(_write_member(tmp_path, "a")) is None
+        assert get_member_package(tmp_path / "missing") is None
+
+
+class TestMergeMemberPaths:
+    def test_main(self, *, tmp_path: Path) -> None:
+        member = _write_member(tmp_path, "a")
+        path = member / PYPROJECT_TOML
+        result = merge_member_paths(path, target=PYPROJECT_TOML, root=tmp_path)
+        assert result == [path.resolve()]
+
+    def test_config(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        _ = _write_member(tmp_path, "a")
+        result = merge_member_paths(PRE_COMMIT_CONFIG_YAML, target=ENVRC)
+        assert result == [(tmp_path / ENVRC).resolve()]
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from itertools import cycle
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import ENVRC, PRE_COMMIT_CONFIG_YAML, PYPROJECT_TOML
+from pytest import raises
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks import _dispatch
+from qrt_pre_commit_hooks._constants import (
+    QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL,
+    SETTINGS_TOML,
+)
+from qrt_pre_commit_hooks._dispatch import (
+    ConvergeCycleError,
+    ConvergeLimitError,
+    check_hooks,
+    converge_hooks,
+    get_hooks_args,
+    run_hooks,
+)
+from qrt_pre_commit_hooks._executor import get_target
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest import MonkeyPatch
+
+
+def _spy_targets(monkeypatch: MonkeyPatch, /) -> list[tuple[Path, Path]]:
+    pairs: list[tuple[Path, Path]] = []
+
+    def run_all(*funcs: Callable[[], bool]) -> bool:
+        stage = Path.cwd()
+        pairs.extend((stage, t) for f in funcs if (t := get_target(f)) is not None)
+        return True
+
+    monkeypatch.setattr(_dispatch, "run_all", run_all)
+    return pairs
+
+
+def _write_config(root: Path, /) -> None:
+    _ = (root / PRE_COMMIT_CONFIG_YAML).write_text(
+        normalize_multi_line_str(f"""
+            repos:
+              - repo: {QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL}
+                rev: 0.0.0
+                hooks:
+                  - id: modify-direnv
+                    args:
+                      - --package=trading
+                  - id: modify-pyproject
+                    args:
+                      - --package=trading
+                  - id: unknown-hook
+        """)
+    )
+
+
+class TestCheckHooks:
+    def test_read_only(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        _write_config(tmp_path)
+        before = {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()}
+        pairs = _spy_targets(monkeypatch)
+        _ = check_hooks(tmp_path)
+        assert len(pairs) >= 2
+        assert all(target.is_relative_to(stage) for stage, target in pairs)
+        after = {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()}
+        assert after == before
+
+    def test_main(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        result = check_hooks(tmp_path)
+        assert result.results == {"modify-direnv": False, "modify-pyproject": False}
+        assert not result.passed
+        assert f"+++ b/{ENVRC}" in result.diff
+        assert not (tmp_path / ENVRC).exists()
+        _ = run_hooks(tmp_path)
+        result = check_hooks(tmp_path)
+        assert result.passed
+        assert result.diff == ""
+
+    def test_settings(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        _ = (tmp_path / SETTINGS_TOML).write_text(
+            '[qrt_pre_commit_hooks.indexes]\nstrategy = "unsafe-best-match"\n'
+        )
+        result = check_hooks(tmp_path, hooks=["modify-pyproject"])
+        assert '+index-strategy = "unsafe-best-match"' in result.diff
+        _ = run_hooks(tmp_path, hooks=["modify-pyproject"])
+        assert check_hooks(tmp_path, hooks=["modify-pyproject"]).passed
+
+
+class TestConvergeHooks:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / PYPROJECT_TOML).write_text(
+            normalize_multi_line_str("""
+                [project]
+                  name = "backfill"
+            """)
+        )
+        passes = converge_hooks(tmp_path)
+        assert len(passes) >= 2
+        assert all(passes[-1].values())
+        assert set(get_hooks_args(tmp_path / PRE_COMMIT_CONFIG_YAML)) >= {
+            "modify-direnv",
+            "modify-pre-commit",
+            "modify-pyproject",
+        }
+        assert (tmp_path / ENVRC).is_file()
+        assert len(converge_hooks(tmp_path)) == 1
+
+    def test_targets_in_stage(
+        self, *, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        _ = (tmp_path / PYPROJECT_TOML).write_text("[project]\nname = 'backfill'\n")
+        pairs = _spy_targets(monkeypatch)
+        _ = converge_hooks(tmp_path)
+        assert len(pairs) >= 1
+        assert all(target.is_relative_to(stage) for stage, target in pairs)
+        assert {p.name for p in tmp_path.iterdir()} == {PYPROJECT_TOML.name}
+
+    def test_limit(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / PYPROJECT_TOML).write_text("[project]\nname = 'backfill'\n")
+        with raises(ConvergeLimitError, match=r"within 1 pass"):
+            _ = converge_hooks(tmp_path, max_iterations=1)
+
+    def test_cycle(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        values = cycle(["a: 1\n", "a: 2\n"])
+
+        def run_hook(*_args: object, root: Path, **_kwargs: object) -> bool:
+            _ = (root / PRE_COMMIT_CONFIG_YAML).write_text(next(values))
+            return False
+
+        monkeypatch.setattr(_dispatch, "run_hook", run_hook)
+        with raises(ConvergeCycleError, match=r"after 3 pass"):
+            _ = converge_hooks(tmp_path, write=False)
+
+
+class TestGetHooksArgs:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        result = get_hooks_args(tmp_path / PRE_COMMIT_CONFIG_YAML)
+        expected = {
+            "modify-direnv": ["--package=trading"],
+            "modify-pyproject": ["--package=trading"],
+        }
+        assert result == expected
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        assert get_hooks_args(tmp_path / PRE_COMMIT_CONFIG_YAML) == {}
+
+
+class TestRunHooks:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        for i in range(2):
+            result = run_hooks(tmp_path)
+            expected = {"modify-direnv": i >= 1, "modify-pyproject": i >= 1}
+            assert result == expected
+            assert (tmp_path / ENVRC).is_file()
+            assert (tmp_path / PYPROJECT_TOML).is_file()
+
+    def test_settings(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        _ = (tmp_path / SETTINGS_TOML).write_text(
+            '[qrt_pre_commit_hooks.indexes]\nstrategy = "unsafe-best-match"\n'
+        )
+        _ = run_hooks(tmp_path, hooks=["modify-pyproject"])
+        text = (tmp_path / PYPROJECT_TOML).read_text()
+        assert 'index-strategy = "unsafe-best-match"' in text
+
+    def test_selection(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        result = run_hooks(tmp_path, hooks=["modify-direnv"])
+        assert result == {"modify-direnv": False}
+        assert (tmp_path / ENVRC).is_file()
+        assert not (tmp_path / PYPROJECT_TOML).exists()
+
+    def test_no_write(self, *, tmp_path: Path) -> None:
+        _write_config(tmp_path)
+        for _ in range(2):
+            result = run_hooks(tmp_path, write=False)
+            assert result == {"modify-direnv": False, "modify-pyproject": False}
+        assert not (tmp_path / ENVRC).exists()
+        assert not (tmp_path / PYPROJECT_TOML).exists()
+
+    def test_targets_in_stage(
+        self, *, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        _write_config(tmp_path)
+        pairs = _spy_targets(monkeypatch)
+        _ = run_hooks(tmp_path)
+        assert len(pairs) >= 2
+        for stage, target in pairs:
+            assert stage != tmp_path.resolve()
+            assert target.is_relative_to(stage)
+        assert {p.name for p in tmp_path.iterdir()} == {PRE_COMMIT_CONFIG_YAML.name}
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from threading import Barrier
+from time import sleep
+from typing import TYPE_CHECKING
+
+from pytest import raises
+
+from qrt_pre_commit_hooks._cache import NO_CACHE_ENV_VAR, cached_run
+from qrt_pre_commit_hooks._executor import get_target, run_funcs, run_parallel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+def _get_func(path: Path, func: Callable[[], bool], /) -> Callable[[], bool]:
+    return cached_run("hook", func, paths=[path])
+
+
+class TestGetTarget:
+    def test_main(self, *, tmp_path: Path) -> None:
+        func = _get_func(tmp_path / "file", lambda: True)
+        assert get_target(func) == (tmp_path / "file").resolve()
+
+    def test_plain(self) -> None:
+        assert get_target(lambda: True) is None
+
+
+class TestRunParallel:
+    def test_concurrent(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        barrier = Barrier(2, timeout=5.0)
+
+        def func() -> bool:
+            _ = barrier.wait()
+            return True
+
+        funcs = [_get_func(tmp_path / "a", func), _get_func(tmp_path / "b", func)]
+        assert run_parallel(funcs, jobs=2) == [True, True]
+
+    def test_same_file(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        calls: list[int] = []
+
+        def get_func(i: int, /) -> Callable[[], bool]:
+            def func() -> bool:
+                sleep(0.01 * (3 - i))
+                calls.append(i)
+                return True
+
+            return _get_func(tmp_path / "file", func)
+
+        _ = run_parallel([get_func(i) for i in range(3)], jobs=3)
+        assert calls == [0, 1, 2]
+
+    def test_order_and_errors(
+        self, *, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+
+        def error() -> bool:
+            msg = "boom"
+            raise ValueError(msg)
+
+        funcs = [
+            _get_func(tmp_path / "a", lambda: True),
+            _get_func(tmp_path / "b", error),
+            _get_func(tmp_path / "c", lambda: False),
+        ]
+        first, second, third = run_parallel(funcs, jobs=3)
+        assert first is True
+        assert isinstance(second, ValueError)
+        assert third is False
+
+
+class TestRunFuncs:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+        paths = [tmp_path / f"file-{i}" for i in range(10)]
+        run_funcs([_get_func(p, lambda: True) for p in paths], jobs=4)
+
+    def test_error(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "1")
+
+        def error() -> bool:
+            msg = "boom"
+            raise ValueError(msg)
+
+        with raises(ValueError, match="boom"):
+            run_funcs([_get_func(tmp_path / "a", error)] * 2, jobs=2)
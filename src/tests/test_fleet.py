@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import ENVRC, PRE_COMMIT_CONFIG_YAML
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks._constants import QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL
+from qrt_pre_commit_hooks._fleet import FleetStatus, get_fleet_repos, run_fleet
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_repo(root: Path, /, *, valid: bool = True) -> Path:
+    (root / ".git").mkdir(parents=True)
+    text = (
+        normalize_multi_line_str(f"""
+            repos:
+              - repo: {QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL}
+                rev: 0.0.0
+                hooks:
+                  - id: modify-direnv
+                    args:
+                      - --package=trading
+        """)
+        if valid
+        else "repos: ["
+    )
+    _ = (root / PRE_COMMIT_CONFIG_YAML).write_text(text)
+    return root
+
+
+class TestGetFleetRepos:
+    def test_dir(self, *, tmp_path: Path) -> None:
+        repos = [_write_repo(tmp_path / n) for n in ["a", "b"]]
+        (tmp_path / "not-a-repo").mkdir()
+        assert get_fleet_repos(dir_=tmp_path) == repos
+
+    def test_base(self, *, tmp_path: Path) -> None:
+        repo = _write_repo(tmp_path / "backfill")
+        (tmp_path / "unregistered").mkdir()
+        assert get_fleet_repos(base=tmp_path) == [repo]
+
+
+class TestRunFleet:
+    def test_main(self, *, tmp_path: Path) -> None:
+        good = _write_repo(tmp_path / "good")
+        bad = _write_repo(tmp_path / "bad", valid=False)
+        logs = tmp_path / "logs"
+        for i in range(2):
+            results = run_fleet([good, bad], jobs=2, logs=logs)
+            assert [r.repo for r in results] == [good, bad]
+            exp_status = FleetStatus.conformant if i >= 1 else FleetStatus.modified
+            assert results[0].status is exp_status
+            assert results[1].status is FleetStatus.error
+            assert results[1].traceback == logs / "bad.txt"
+        assert (good / ENVRC).is_file()
+
+    def test_dry_run(self, *, tmp_path: Path) -> None:
+        repo = _write_repo(tmp_path / "repo")
+        for _ in range(2):
+            (result,) = run_fleet([repo], dry_run=True, logs=tmp_path / "logs")
+            assert result.status is FleetStatus.modified
+            assert result.hooks == {"modify-direnv": False}
+        assert {p.name for p in repo.iterdir()} == {".git", PRE_COMMIT_CONFIG_YAML.name}
+
+    def test_added_hooks(self, *, tmp_path: Path) -> None:
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        _ = (repo / PRE_COMMIT_CONFIG_YAML).write_text(
+            normalize_multi_line_str(f"""
+                repos:
+                  - repo: {QUEENSBERRY_RESEARCH_PRE_COMMIT_HOOKS_URL}
+                    rev: 0.0.0
+                    hooks:
+                      - id: add-qrt-hooks
+            """)
+        )
+        (result,) = run_fleet([repo], logs=tmp_path / "logs")
+        assert result.traceback is None
+        assert set(result.hooks) == {
+            "add-qrt-hooks",
+            "modify-direnv",
+            "modify-pre-commit",
+        }
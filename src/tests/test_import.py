@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+from subprocess import check_output
+from typing import TYPE_CHECKING
+
+from pytest import mark
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_LIGHT = [
+    "qrt_pre_commit_hooks",
+    "qrt_pre_commit_hooks._client",
+    "qrt_pre_commit_hooks._constants",
+    "qrt_pre_commit_hooks._enums",
+    "qrt_pre_commit_hooks._spans",
+]
+_HEAVY = [
+    "click",
+    "pydantic",
+    "qrt_pre_commit_hooks._settings",
+    "tomlkit",
+    "utilities",
+    "yaml",
+]
+
+
+class TestNoSideEffects:
+    @mark.parametrize("module", _LIGHT)
+    def test_main(self, *, module: str, tmp_path: Path) -> None:
+        code = "; ".join([
+            "import sys",
+            "hook = sys.excepthook",
+            f"import {module}",
+            "assert sys.excepthook is hook",
+            "print(' '.join(sorted(sys.modules)))",
+        ])
+        output = check_output([sys.executable, "-c", code], cwd=tmp_path, text=True)
+        modules = set(output.split())
+        assert modules.isdisjoint(_HEAVY)
+        assert not (tmp_path / ".logs").exists()
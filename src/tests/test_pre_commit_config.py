@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from os import utime
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import DYCW_PRE_COMMIT_HOOKS_URL, PRE_COMMIT_CONFIG_YAML
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks._pre_commit_config import (
+    _load_cached,
+    get_hook_args,
+    get_python_version,
+    load_config,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_config(root: Path, /, *, version: str = "3.13") -> Path:
+    path = root / PRE_COMMIT_CONFIG_YAML
+    _ = path.write_text(
+        normalize_multi_line_str(f"""
+            repos:
+              - repo: {DYCW_PRE_COMMIT_HOOKS_URL}
+                rev: 0.0.0
+                hooks:
+                  - id: add-hooks
+                    args:
+                      - --python
+                      - --python-version={version}
+                  - id: no-args
+        """)
+    )
+    return path
+
+
+class TestGetHookArgs:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = _write_config(tmp_path)
+        args = get_hook_args(DYCW_PRE_COMMIT_HOOKS_URL, "add-hooks", path=path)
+        assert args == ["--python", "--python-version=3.13"]
+        assert get_hook_args(DYCW_PRE_COMMIT_HOOKS_URL, "no-args", path=path) == []
+        assert get_hook_args(DYCW_PRE_COMMIT_HOOKS_URL, "missing", path=path) is None
+        assert get_hook_args("https://example.com", "add-hooks", path=path) is None
+
+
+class TestGetPythonVersion:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = _write_config(tmp_path)
+        assert get_python_version(path=path) == "3.13"
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        assert get_python_version(path=tmp_path / PRE_COMMIT_CONFIG_YAML) is None
+
+
+class TestLoadConfig:
+    def test_cached(self, *, tmp_path: Path) -> None:
+        path = _write_config(tmp_path)
+        assert _load_cached(path) is _load_cached(path)
+
+    def test_copy(self, *, tmp_path: Path) -> None:
+        path = _write_config(tmp_path)
+        load_config(path)["repos"].clear()
+        assert get_python_version(path=path) == "3.13"
+
+    def test_invalidated(self, *, tmp_path: Path) -> None:
+        path = _write_config(tmp_path)
+        assert get_python_version(path=path) == "3.13"
+        stat = path.stat()
+        _ = _write_config(tmp_path, version="3.12")
+        utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert get_python_version(path=path) == "3.12"
+
+    def test_read_only(self, *, tmp_path: Path) -> None:
+        path = tmp_path / PRE_COMMIT_CONFIG_YAML
+        _ = path.write_text("repos: []\n")
+        _ = get_python_version(path=path)
+        assert path.read_text() == "repos: []\n"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from os import utime
+from tomllib import TOMLDecodeError
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import PYPROJECT_TOML
+from pytest import raises
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks._enums import Package
+from qrt_pre_commit_hooks._project import get_project_info
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+def _write_pyproject(root: Path, /, *, name: str = "backfill") -> Path:
+    path = root / PYPROJECT_TOML
+    _ = path.write_text(
+        normalize_multi_line_str(f"""
+            [project]
+            name = "{name}"
+            dependencies = ["click>=8"]
+
+            [project.scripts]
+            {name}-cli = "{name}:main"
+        """)
+    )
+    return path
+
+
+class TestGetProjectInfo:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _ = _write_pyproject(tmp_path)
+        info = get_project_info(tmp_path)
+        assert info.root == tmp_path.resolve()
+        assert info.name == "backfill"
+        assert info.scripts == {"backfill-cli": "backfill:main"}
+        assert info.dependencies == ("click>=8",)
+        assert info.package is Package.trading
+        assert info.need_docker
+        assert info.python_version is None
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        info = get_project_info(tmp_path)
+        assert info.name is None
+        assert info.package is None
+        assert not info.need_docker
+
+    def test_cached(self, *, tmp_path: Path) -> None:
+        _ = _write_pyproject(tmp_path)
+        assert get_project_info(tmp_path) is get_project_info(tmp_path)
+
+    def test_invalidated(self, *, tmp_path: Path) -> None:
+        path = _write_pyproject(tmp_path)
+        assert get_project_info(tmp_path).name == "backfill"
+        stat = path.stat()
+        _ = _write_pyproject(tmp_path, name="other")
+        utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert get_project_info(tmp_path).name == "other"
+
+    def test_invalid(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / PYPROJECT_TOML).write_text("[project\n")
+        with raises(TOMLDecodeError):
+            _ = get_project_info(tmp_path)
+
+    def test_settings(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        _ = _write_pyproject(tmp_path)
+        info = get_project_info(tmp_path)
+        monkeypatch.setenv("INDEXES__STRATEGY", "unsafe-best-match")
+        assert get_project_info(tmp_path) is not info
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from json import dumps, loads
+from os import environ
+from socket import AF_UNIX, SHUT_WR, SOCK_STREAM, socket
+from threading import Thread
+from time import sleep
+from typing import TYPE_CHECKING
+
+from pytest import raises
+
+from qrt_pre_commit_hooks import _client
+from qrt_pre_commit_hooks._client import request
+from qrt_pre_commit_hooks._server import (
+    _LOCK,
+    UnsafeSocketDirError,
+    _yield_request_env,
+    run_request,
+    serve,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+def _start(path: Path, /) -> Thread:
+    thread = Thread(target=serve, kwargs={"path": path, "idle_timeout": 10.0})
+    thread.start()
+    for _ in range(500):
+        if path.exists():
+            break
+        sleep(0.01)
+    return thread
+
+
+def _send(path: Path, data: bytes, /) -> dict[str, object]:
+    with socket(AF_UNIX, SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(data)
+        sock.shutdown(SHUT_WR)
+        return loads(b"".join(iter(lambda: sock.recv(65536), b"")))
+
+
+class TestRunRequest:
+    def test_help(self) -> None:
+        response = run_request("modify-pyproject", ["--help"])
+        assert response.exit_code == 0
+        assert "Usage: modify-pyproject" in response.stdout
+
+    def test_usage_error(self) -> None:
+        response = run_request("modify-pyproject", [])
+        assert response.exit_code == 2
+        assert "Missing option '--package'" in response.stderr
+
+
+class TestServe:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "hooks.sock"
+        thread = _start(path)
+        try:
+            for _ in range(2):
+                response = request("modify-pyproject", ["--help"], path=path)
+                assert response is not None
+                assert response == run_request("modify-pyproject", ["--help"])
+        finally:
+            monkeypatch.setattr(_client, "__version__", "0.0.0")
+            assert request("modify-pyproject", [], path=path) is None
+            thread.join()
+        assert not path.exists()
+
+    def test_invalid(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "hooks.sock"
+        thread = _start(path)
+        try:
+            requests = [
+                b"not json",
+                dumps({"hook": "modify-pyproject"}).encode(),
+                dumps({
+                    "version": "0.0.0",
+                    "hook": "unknown",
+                    "argv": [],
+                    "cwd": str(tmp_path),
+                    "env": {},
+                }).encode(),
+            ]
+            for data in requests:
+                response = _send(path, data)
+                assert response["exit_code"] == 1
+                assert "Invalid request" in str(response["stderr"])
+            assert request("modify-pyproject", ["--help"], path=path) is not None
+        finally:
+            monkeypatch.setattr(_client, "__version__", "0.0.0")
+            assert request("modify-pyproject", [], path=path) is None
+            thread.join()
+
+    def test_unsafe_dir(self, *, tmp_path: Path) -> None:
+        tmp_path.chmod(0o777)
+        with raises(UnsafeSocketDirError):
+            serve(path=tmp_path / "hooks.sock", idle_timeout=0.1)
+
+
+class TestYieldRequestEnv:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("SERVER_ONLY", "1")
+        monkeypatch.setenv("QRT_PRE_COMMIT_HOOKS_NO_CACHE", "1")
+        env = {"AWS_SECRET_ACCESS_KEY": "secret", "QRT_PRE_COMMIT_HOOKS_TRACE": "1"}
+        with _yield_request_env(tmp_path, env):
+            assert environ.get("SERVER_ONLY") == "1"
+            assert "AWS_SECRET_ACCESS_KEY" not in environ
+            assert "QRT_PRE_COMMIT_HOOKS_NO_CACHE" not in environ
+            assert environ.get("QRT_PRE_COMMIT_HOOKS_TRACE") == "1"
+        assert "QRT_PRE_COMMIT_HOOKS_TRACE" not in environ
+        assert environ.get("QRT_PRE_COMMIT_HOOKS_NO_CACHE") == "1"
+
+    def test_lock(self, *, tmp_path: Path) -> None:
+        with _yield_request_env(tmp_path, {}):
+            assert _LOCK.locked()
+        assert not _LOCK.locked()
@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+import sys
+from os import utime
 from re import search
+from subprocess import check_output
 from typing import TYPE_CHECKING
 
-from pytest import mark, param
+from pytest import mark, param, raises
+from utilities.core import one
 from utilities.pydantic import extract_secret
 
 from qrt_pre_commit_hooks import SETTINGS
-from qrt_pre_commit_hooks._enums import Index
-from qrt_pre_commit_hooks._settings import _Settings
+from qrt_pre_commit_hooks._enums import Index, Package
+from qrt_pre_commit_hooks._settings import (
+    _MAX_SNAPSHOTS,
+    DuplicatePackageError,
+    PackageRegistry,
+    _load_settings,
+    _PackageSettings,
+    _Settings,
+    get_settings,
+    get_settings_key,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest import MonkeyPatch
+
 
 class TestSettings:
     def test_main(self) -> None:
-        assert isinstance(SETTINGS, _Settings)
+        assert isinstance(get_settings(), _Settings)
+
+    def test_lazy(self) -> None:
+        assert SETTINGS.gitea is get_settings().gitea
 
     @mark.parametrize(
         "path", [param(SETTINGS.configs.dockerfile), param(SETTINGS.configs.root_pem)]
@@ -24,6 +42,11 @@ class TestSettings:
     def test_configs(self, *, path: Path) -> None:
         assert path.is_file()
 
+    @mark.parametrize("index", Index)
+    def test_read_url(self, *, index: Index) -> None:
+        result = SETTINGS.indexes.read_url(index)
+        assert search(r"^https://.*[^/]/simple$", result) is not None
+
     @mark.parametrize("index", Index)
     def test_url(self, *, index: Index) -> None:
         result = SETTINGS.indexes.url(index)
@@ -39,3 +62,94 @@ class TestSettings:
     def test_password_ci(self, *, index: Index, write: bool) -> None:
         result = extract_secret(SETTINGS.indexes.password(index, write=write, ci=True))
         assert search(r"^\${{secrets\.[A-Z_]+}}$", result) is not None
+
+
+class TestSnapshot:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        first = _load_settings()
+        path = one((tmp_path / "qrt-pre-commit-hooks" / "settings").iterdir())
+        assert path.stat().st_mode & 0o777 == 0o600
+        second = _load_settings()
+        assert isinstance(second, _Settings)
+        assert second.model_dump() == first.model_dump()
+        assert second.indexes.url(Index.gitea) == first.indexes.url(Index.gitea)
+
+    def test_fresh_process(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        code = "from qrt_pre_commit_hooks import SETTINGS; print(SETTINGS.indexes.strategy)"
+        for _ in range(2):  # write the snapshot, then read it back
+            result = check_output([sys.executable, "-c", code], text=True)
+            assert result.strip() == SETTINGS.indexes.strategy
+        _ = one((tmp_path / "qrt-pre-commit-hooks" / "settings").iterdir())
+
+    def test_no_secrets(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        secret = _load_settings().gitea.passwords.read.get_secret_value()
+        path = one((tmp_path / "qrt-pre-commit-hooks" / "settings").iterdir())
+        assert secret not in path.read_text()
+        second = _load_settings()
+        assert second.gitea.passwords.read.get_secret_value() == secret
+
+    def test_corrupt(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        first = _load_settings()
+        path = one((tmp_path / "qrt-pre-commit-hooks" / "settings").iterdir())
+        _ = path.write_text("{")
+        second = _load_settings()
+        assert second.model_dump() == first.model_dump()
+
+    def test_other_keys(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        path = tmp_path / "qrt-pre-commit-hooks" / "settings"
+        path.mkdir(parents=True)
+        other = path / "other.json"
+        _ = other.write_text("{}")
+        _ = _load_settings()
+        assert other.exists()
+        assert len(list(path.iterdir())) == 2
+
+    def test_limit(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        path = tmp_path / "qrt-pre-commit-hooks" / "settings"
+        path.mkdir(parents=True)
+        for i in range(2 * _MAX_SNAPSHOTS):
+            stale = path / f"{i}.json"
+            _ = stale.write_text("{}")
+            utime(stale, ns=(i, i))
+        _ = _load_settings()
+        assert len(list(path.iterdir())) == _MAX_SNAPSHOTS
+        assert (path / f"{get_settings_key()}.json").exists()
+
+    def test_key_env(self, *, monkeypatch: MonkeyPatch) -> None:
+        before = get_settings_key()
+        monkeypatch.setenv("GITEA__HOST", "example.com")
+        assert get_settings_key() != before
+
+    def test_key_toml(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        before = get_settings_key()
+        _ = (tmp_path / "settings.toml").write_text("[qrt_pre_commit_hooks]\n")
+        assert get_settings_key() != before
+
+
+class TestPackageRegistry:
+    def test_main(self) -> None:
+        registry = SETTINGS.registry
+        assert registry.get("backfill") is Package.trading
+        assert registry.get("gitea") is Package.infra
+        assert registry.get("unknown") is None
+        for package in Package:
+            names = registry.names[package]
+            assert list(names) == sorted(names)
+            assert all(registry.get(n) is package for n in names)
+
+    def test_duplicate(self) -> None:
+        packages = [
+            _PackageSettings(name="name", type=Package.trading),
+            _PackageSettings(name="name", type=Package.infra),
+        ]
+        with raises(
+            DuplicatePackageError, match=r"Package 'name' is defined more than once"
+        ):
+            _ = PackageRegistry.from_packages(packages)
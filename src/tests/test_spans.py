@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pytest import approx, fixture
+
+from qrt_pre_commit_hooks._cache import NO_CACHE_ENV_VAR, cached_run
+from qrt_pre_commit_hooks._spans import (
+    SPANS_JSONL,
+    TRACE_ENV_VAR,
+    Span,
+    read_spans,
+    summarize_spans,
+    yield_span,
+)
+from qrt_pre_commit_hooks._utilities import yield_text_file
+from qrt_pre_commit_hooks._workspace import yield_workspace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+@fixture(autouse=True)
+def chdir(*, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv(NO_CACHE_ENV_VAR, raising=False)
+    monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+
+
+class TestYieldSpan:
+    def test_disabled(self) -> None:
+        with yield_span("run", hook="hook") as span:
+            assert span is None
+        assert not SPANS_JSONL.exists()
+
+    def test_enabled(self, *, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(TRACE_ENV_VAR, "1")
+        with yield_span("run", hook="hook", path="path"), yield_span("parse"):
+            pass
+        inner, outer = read_spans()
+        assert (inner.hook, inner.phase) == ("hook", "parse")
+        assert (outer.hook, outer.phase, outer.path) == ("hook", "run", "path")
+        assert outer.duration >= inner.duration
+
+    def test_cached_run(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(TRACE_ENV_VAR, "1")
+        path = tmp_path / "file"
+        _ = path.write_text("text")
+        func = cached_run("hook", lambda: True, paths=[path])
+        for _ in range(2):
+            assert func()
+        first, second = read_spans()
+        assert first.cached is None
+        assert second.cached is True
+
+
+class TestYieldTextFile:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(TRACE_ENV_VAR, "1")
+        path = tmp_path / "file.txt"
+        _ = path.write_text("text\n")
+        with yield_text_file(path) as context:
+            context.output += "more\n"
+        spans = read_spans()
+        assert [s.phase for s in spans] == ["parse", "mutate", "write"]
+        assert {s.context for s in spans} == {"yield_text_file"}
+        parse, _, write = spans
+        assert parse.bytes_read == len("text\n")
+        assert write.written is True
+        assert write.bytes_written == len("text\nmore\n")
+
+
+class TestYieldSpansRoot:
+    def test_workspace(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv(TRACE_ENV_VAR, "1")
+        with yield_span("before"):
+            pass
+        with yield_workspace(tmp_path) as workspace:
+            monkeypatch.chdir(workspace.stage)
+            with yield_span("staged"):
+                pass
+            assert workspace.get_changes() == {}
+        monkeypatch.chdir(tmp_path)
+        assert [s.phase for s in read_spans()] == ["before", "staged"]
+
+
+class TestSummarizeSpans:
+    def test_main(self) -> None:
+        spans = [
+            Span(hook="hook", phase="run", time=0.0, pid=0, duration=d)
+            for d in [0.1, 0.2, 0.3, 0.4]
+        ]
+        summary, total = summarize_spans(spans)
+        assert (summary.hook, summary.phase, summary.count) == ("hook", "run", 4)
+        assert summary.p50 == approx(0.2)
+        assert summary.p99 == approx(0.4)
+        assert summary.max == approx(0.4)
+        assert total.hook is None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from utilities.core import normalize_multi_line_str
+
+from qrt_pre_commit_hooks._toml import get_project, read_toml
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestGetProject:
+    def test_main(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = path.write_text(
+            normalize_multi_line_str("""
+                [project]
+                name = "package"
+
+                [project.scripts]
+                package-cli = "package:main"
+            """)
+        )
+        assert get_project(path) == {
+            "name": "package",
+            "scripts": {"package-cli": "package:main"},
+        }
+
+    def test_no_project(self, *, tmp_path: Path) -> None:
+        path = tmp_path / "pyproject.toml"
+        _ = path.write_text("[tool.uv]\n")
+        assert get_project(path) == {}
+
+    def test_missing(self, *, tmp_path: Path) -> None:
+        assert get_project(tmp_path / "pyproject.toml") == {}
+
+
+class TestReadToml:
+    def test_missing(self, *, tmp_path: Path) -> None:
+        assert read_toml(tmp_path / "pyproject.toml") is None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pre_commit_hooks.constants import ENVRC, PYPROJECT_TOML
+
+from qrt_pre_commit_hooks._constants import DOCKERFILE
+from qrt_pre_commit_hooks._workspace import run_check, yield_workspace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest import CaptureFixture, MonkeyPatch
+
+
+class TestRunCheck:
+    def test_main(
+        self, *, tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        _ = Path("file.txt").write_text("before\n")
+
+        def get_funcs(*, paths: tuple[Path, ...]) -> list[Callable[[], bool]]:
+            def func() -> bool:
+                for path in paths:
+                    _ = path.write_text("after\n")
+                return True
+
+            return [func]
+
+        run_check(get_funcs, paths=[Path("file.txt")])
+        assert Path("file.txt").read_text() == "before\n"
+        out = capsys.readouterr().out
+        assert "--- a/file.txt" in out
+        assert "-before" in out
+        assert "+after" in out
+
+
+class TestYieldWorkspace:
+    def test_main(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / ENVRC).write_text("envrc")
+        _ = (tmp_path / PYPROJECT_TOML).write_text("pyproject")
+        with yield_workspace(tmp_path) as workspace:
+            assert (workspace.stage / ENVRC).read_text() == "envrc"
+            _ = (workspace.stage / ENVRC).write_text("modified")
+            (workspace.stage / DOCKERFILE).parent.mkdir(parents=True)
+            _ = (workspace.stage / DOCKERFILE).write_text("dockerfile")
+            assert set(workspace.get_changes()) == {Path(ENVRC), DOCKERFILE}
+            assert (tmp_path / ENVRC).read_text() == "envrc"
+        assert (tmp_path / ENVRC).read_text() == "modified"
+        assert (tmp_path / DOCKERFILE).read_text() == "dockerfile"
+        assert (tmp_path / PYPROJECT_TOML).read_text() == "pyproject"
+
+    def test_no_write(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / ENVRC).write_text("envrc")
+        with yield_workspace(tmp_path, write=False) as workspace:
+            _ = (workspace.stage / ENVRC).write_text("modified")
+        assert (tmp_path / ENVRC).read_text() == "envrc"
+
+    def test_diff(self, *, tmp_path: Path) -> None:
+        _ = (tmp_path / ENVRC).write_text("line\n")
+        with yield_workspace(tmp_path, write=False) as workspace:
+            assert workspace.get_diff() == ""
+            _ = (workspace.stage / ENVRC).write_text("line\nmore\n")
+            diff = workspace.get_diff()
+        assert f"+++ b/{ENVRC}" in diff
+        assert "+more" in diff
+
+    def test_paths(self, *, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        _ = (tmp_path / "sub" / "file.txt").write_text("file")
+        _ = (tmp_path / "sub" / ENVRC).write_text("envrc")
+        with yield_workspace(tmp_path, paths=["sub/file.txt"]) as workspace:
+            assert (workspace.stage / "sub" / "file.txt").read_text() == "file"
+            assert (workspace.stage / "sub" / ENVRC).read_text() == "envrc"
+            path = workspace.get_stage_path(tmp_path.resolve() / "sub" / "file.txt")
+            assert path == workspace.stage / "sub" / "file.txt"